@@ -131,8 +131,10 @@ def convert_pydantic_field(
                 min_inclusive=hasattr(constraint, "ge"),
                 max_inclusive=hasattr(constraint, "le"),
             ))
-        if hasattr(constraint, "pattern"):
-            validators.append(Regexp(constraint.pattern))
+        # StringConstraints always carries a pattern attribute, None when unset
+        pattern = getattr(constraint, "pattern", None)
+        if pattern is not None:
+            validators.append(Regexp(pattern))
     if min_len is not None or max_len is not None:
         validators.append(Length(min=min_len, max=max_len))
     if validators:
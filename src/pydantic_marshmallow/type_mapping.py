@@ -8,6 +8,7 @@ TYPE_MAPPING for basic types and adding support for generic collections.
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable
 from enum import Enum as PyEnum
 from functools import lru_cache
 from types import UnionType
@@ -37,6 +38,77 @@ def _get_simple_field_class(type_hint: type) -> type[Any]:
     return Schema.TYPE_MAPPING.get(type_hint, ma_fields.Raw)
 
 
+# Pydantic networking types matched by exact name to avoid false positives
+# (e.g. "ZIPCode", "RecIPe").
+_PYDANTIC_URL_MARKERS = ('Url', 'URL', 'HttpUrl', 'AnyUrl')
+_PYDANTIC_IP_TYPES = frozenset({
+    'IPvAnyAddress', 'IPvAnyInterface', 'IPvAnyNetwork',
+    'IPv4Address', 'IPv6Address', 'IPv4Interface', 'IPv6Interface',
+    'IPv4Network', 'IPv6Network',
+})
+
+
+def _match_pydantic_special_field_class(type_hint: Any) -> type[Any] | None:
+    """Return the Marshmallow field class for a Pydantic special type, or None."""
+    type_module = getattr(type_hint, '__module__', '')
+    if 'pydantic' not in type_module:
+        return None
+    type_name = getattr(type_hint, '__name__', str(type_hint))
+    if 'EmailStr' in type_name:
+        return ma_fields.Email
+    if any(marker in type_name for marker in _PYDANTIC_URL_MARKERS):
+        return ma_fields.URL
+    if type_name in _PYDANTIC_IP_TYPES:
+        return getattr(ma_fields, 'IP', ma_fields.String)
+    return None
+
+
+# PERFORMANCE: The module/name string matching runs once per type instead of
+# on every conversion of a field with that type.
+_get_pydantic_special_field_class = lru_cache(maxsize=512)(_match_pydantic_special_field_class)
+
+
+def _list_field(args: tuple[Any, ...]) -> Any:
+    """Build a List field for list[T], set[T] and frozenset[T]."""
+    inner = type_to_marshmallow_field(args[0]) if args else ma_fields.Raw()
+    return ma_fields.List(inner)
+
+
+def _dict_field(args: tuple[Any, ...]) -> Any:
+    """Build a Dict field for dict[K, V]."""
+    key_field = ma_fields.String()
+    value_field = ma_fields.Raw()
+    if args and len(args) >= 2:
+        key_field = type_to_marshmallow_field(args[0])
+        value_field = type_to_marshmallow_field(args[1])
+    return ma_fields.Dict(keys=key_field, values=value_field)
+
+
+def _tuple_field(args: tuple[Any, ...]) -> Any:
+    """Build a Tuple (fixed-length) or List (variadic) field for tuple[...]."""
+    if args:
+        # Variable-length tuple: tuple[int, ...] → List(Integer())
+        if len(args) == 2 and args[1] is Ellipsis:
+            return ma_fields.List(type_to_marshmallow_field(args[0]))
+        # Fixed-length tuple with specific types
+        tuple_fields = [type_to_marshmallow_field(arg) for arg in args if arg is not ...]
+        if tuple_fields:
+            return ma_fields.Tuple(tuple_fields=tuple(tuple_fields))  # type: ignore[no-untyped-call,unused-ignore]
+    return ma_fields.List(ma_fields.Raw())
+
+
+# PERFORMANCE: Generic collection origins dispatch through a single dict lookup
+# instead of walking the Literal/Union/Enum/model checks first.
+# set[T] and frozenset[T] convert to List in Marshmallow.
+_ORIGIN_FIELD_FACTORIES: dict[Any, Callable[[tuple[Any, ...]], Any]] = {
+    list: _list_field,
+    set: _list_field,
+    frozenset: _list_field,
+    dict: _dict_field,
+    tuple: _tuple_field,
+}
+
+
 def type_to_marshmallow_field(type_hint: Any) -> Any:
     """
     Map a Python type to a Marshmallow field instance.
@@ -73,6 +145,11 @@ def type_to_marshmallow_field(type_hint: Any) -> Any:
     origin = get_origin(type_hint)
     args = get_args(type_hint)
 
+    # Generic collections: list[T], dict[K, V], set[T], frozenset[T], tuple[...]
+    factory = _ORIGIN_FIELD_FACTORIES.get(origin)
+    if factory is not None:
+        return factory(args)
+
     # Handle NoneType
     if type_hint is type(None):
         return ma_fields.Raw(allow_none=True)
@@ -122,62 +199,14 @@ def type_to_marshmallow_field(type_hint: Any) -> Any:
             with _processing_lock:
                 _processing_models.discard(type_hint)
 
-    # Handle list[T]
-    if origin is list:
-        inner = ma_fields.Raw()
-        if args:
-            inner = type_to_marshmallow_field(args[0])
-        return ma_fields.List(inner)
-
-    # Handle dict[K, V]
-    if origin is dict:
-        key_field = ma_fields.String()
-        value_field = ma_fields.Raw()
-        if args and len(args) >= 2:
-            key_field = type_to_marshmallow_field(args[0])
-            value_field = type_to_marshmallow_field(args[1])
-        return ma_fields.Dict(keys=key_field, values=value_field)
-
-    # Handle set[T] and frozenset[T] - convert to List in Marshmallow
-    if origin in (set, frozenset):
-        inner_set = ma_fields.Raw()
-        if args:
-            inner_set = type_to_marshmallow_field(args[0])
-        return ma_fields.List(inner_set)
-
-    # Handle Tuple - use Marshmallow's Tuple field if available
-    if origin is tuple:
-        if args:
-            # Variable-length tuple: tuple[int, ...] → List(Integer())
-            if len(args) == 2 and args[1] is Ellipsis:
-                return ma_fields.List(type_to_marshmallow_field(args[0]))
-            # Fixed-length tuple with specific types
-            tuple_fields = [type_to_marshmallow_field(arg) for arg in args if arg is not ...]
-            if tuple_fields:
-                return ma_fields.Tuple(tuple_fields=tuple(tuple_fields))  # type: ignore[no-untyped-call,unused-ignore]
-        return ma_fields.List(ma_fields.Raw())
-
-    # Check for Pydantic special types by module
-    type_module = getattr(type_hint, '__module__', '')
-    type_name = getattr(type_hint, '__name__', str(type_hint))
-
-    # Handle Pydantic networking types
-    if 'pydantic' in type_module:
-        if 'EmailStr' in type_name:
-            return ma_fields.Email()
-        url_types = ('Url', 'URL', 'HttpUrl', 'AnyUrl')
-        if any(ut in type_name for ut in url_types):
-            return ma_fields.URL()
-        # Use exact name matching to avoid false positives (e.g. "ZIPCode", "RecIPe")
-        ip_types = (
-            'IPvAnyAddress', 'IPvAnyInterface', 'IPvAnyNetwork',
-            'IPv4Address', 'IPv6Address', 'IPv4Interface', 'IPv6Interface',
-            'IPv4Network', 'IPv6Network',
-        )
-        if type_name in ip_types:
-            if hasattr(ma_fields, 'IP'):
-                return ma_fields.IP()  # type: ignore[no-untyped-call,unused-ignore]
-            return ma_fields.String()
+    # Handle Pydantic special types (EmailStr, AnyUrl, IPvAnyAddress, etc.)
+    try:
+        special_class = _get_pydantic_special_field_class(type_hint)
+    except TypeError:
+        # Unhashable type hint: match without caching
+        special_class = _match_pydantic_special_field_class(type_hint)
+    if special_class is not None:
+        return special_class()
 
     # Use Marshmallow's native TYPE_MAPPING for basic types
     # This ensures we stay in sync with Marshmallow's type handling
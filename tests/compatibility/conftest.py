@@ -4,11 +4,16 @@ Provides common Flask app, client, and model fixtures for all compatibility
 test files to eliminate duplication.
 """
 
+from typing import Annotated
+
+import orjson
 import pytest
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, StringConstraints, field_validator
 
 from pydantic_marshmallow import schema_for
 
+from ..conftest import EMAIL_PATTERN
+
 # =============================================================================
 # Shared Pydantic Models for Compatibility Tests
 # =============================================================================
@@ -103,6 +108,63 @@ class ErrorResponsePydantic(BaseModel):
     details: dict | None = None
 
 
+# =============================================================================
+# Documented API Models (flask-rebar, flask-smorest)
+# =============================================================================
+# Field descriptions feed the generated OpenAPI docs. Defined once here so
+# pydantic builds each validator a single time per test process.
+
+class DocumentedUserPydantic(BaseModel):
+    """User model for API."""
+
+    id: int | None = Field(default=None, description="User ID")
+    # Stripped and length-checked inside pydantic-core, so blank names are
+    # rejected without a Python field_validator call
+    name: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)
+    ] = Field(description="User's full name")
+    email: str = Field(
+        pattern=EMAIL_PATTERN, description="User's email address"
+    )
+    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
+
+
+class DocumentedUserCreatePydantic(BaseModel):
+    """User creation request model."""
+
+    name: str = Field(min_length=1, max_length=100, description="User's full name")
+    email: str = Field(
+        pattern=EMAIL_PATTERN, description="User's email address"
+    )
+    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
+
+
+class DocumentedUserUpdatePydantic(BaseModel):
+    """User update request model (partial)."""
+
+    name: str | None = Field(
+        default=None, min_length=1, max_length=100, description="User's full name"
+    )
+    email: str | None = Field(
+        default=None,
+        pattern=EMAIL_PATTERN,
+        description="User's email address",
+    )
+    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
+
+
+class DocumentedProductPydantic(BaseModel):
+    """Product model for API."""
+
+    id: int | None = Field(default=None, description="Product ID")
+    name: str = Field(min_length=1, max_length=200, description="Product name")
+    price: float = Field(gt=0, description="Product price")
+    description: str | None = Field(
+        default=None, max_length=1000, description="Product description"
+    )
+    tags: list[str] = Field(default_factory=list, description="Product tags")
+
+
 # =============================================================================
 # Test Data Constants
 # =============================================================================
@@ -152,9 +214,24 @@ INVALID_USER_DATA = {
 }
 
 
+# =============================================================================
+# Response Helpers
+# =============================================================================
+
+def json_of(response):
+    """Decode a test-client response body with orjson.
+
+    Parses the raw bytes directly instead of going through Flask's
+    ``get_json()`` content-type handling and stdlib ``json``.
+    """
+    return orjson.loads(response.data)
+
+
 # =============================================================================
 # Schema Factories
 # =============================================================================
+# Instances are built per test, so a test may mutate one (many, partial,
+# context, ...) without leaking state into other tests or xdist workers.
 
 @pytest.fixture
 def user_schema():
@@ -186,11 +263,28 @@ def query_args_schema():
 
 try:
     from flask import Flask
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson.
+
+        Covers ``jsonify`` in handlers and ``json=`` bodies sent by the test
+        client. Flask's ``default`` hook still handles Decimal and friends.
+        """
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
 
     @pytest.fixture
     def flask_app():
         """Basic Flask app for testing."""
         app = Flask(__name__)
+        app.json = OrjsonProvider(app)
         app.config["TESTING"] = True
         app.config["SECRET_KEY"] = "test-secret-key"
         return app
@@ -222,29 +316,42 @@ except ImportError:
     pass
 
 
+# =============================================================================
+# apispec Helpers
+# =============================================================================
+
+def register_schemas(spec, schemas):
+    """Register a ``{component_name: schema_class}`` mapping on an APISpec in one pass."""
+    for name, schema in schemas.items():
+        spec.components.schema(name, schema=schema)
+    return spec
+
+
 # =============================================================================
 # Schema Class Factories
 # =============================================================================
+# Classes are shared for the whole session (each xdist worker builds its own).
+# Do not mutate them; subclass or instantiate instead.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_schema_class():
     """Return the UserPydantic schema class (not instance)."""
     return schema_for(UserPydantic)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_create_schema_class():
     """Return the UserCreatePydantic schema class."""
     return schema_for(UserCreatePydantic)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def product_schema_class():
     """Return the ProductPydantic schema class."""
     return schema_for(ProductPydantic)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_user_schema_class():
     """Return the UserWithAddressPydantic schema class."""
     return schema_for(UserWithAddressPydantic)
@@ -4,6 +4,7 @@ Tests for apispec integration.
 Verifies that PydanticSchema works correctly with apispec
 for OpenAPI specification generation.
 """
+import importlib.util
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -14,14 +15,11 @@ from pydantic import BaseModel, Field
 
 from pydantic_marshmallow import schema_for
 
-# Third-party imports with conditional availability
-try:
-    from apispec import APISpec
-    from apispec.ext.marshmallow import MarshmallowPlugin
+from .conftest import register_schemas
 
-    APISPEC_AVAILABLE = True
-except ImportError:
-    APISPEC_AVAILABLE = False
+# Availability check only - apispec itself is imported lazily in the make_spec
+# fixture so collection (e.g. `-k` runs that deselect this module) stays cheap
+APISPEC_AVAILABLE = importlib.util.find_spec("apispec") is not None
 
 pytestmark = pytest.mark.skipif(
     not APISPEC_AVAILABLE, reason="apispec not installed"
@@ -96,25 +94,74 @@ class OrderPydantic(BaseModel):
     notes: str | None = Field(default=None, description="Order notes")
 
 
+class MinimalModel(BaseModel):
+    """Model with a single required field."""
+
+    name: str
+
+
+class AllOptionalModel(BaseModel):
+    """Model with only optional fields."""
+
+    field1: str | None = None
+    field2: int | None = None
+
+
+class Level3(BaseModel):
+    """Innermost model for deep nesting tests."""
+
+    value: str
+
+
+class Level2(BaseModel):
+    """Middle model for deep nesting tests."""
+
+    level3: Level3
+
+
+class Level1(BaseModel):
+    """Outermost model for deep nesting tests."""
+
+    level2: Level2
+
+
+@pytest.fixture(scope="module")
+def make_spec():
+    """Factory for APISpec instances with MarshmallowPlugin (built once per module)."""
+    from apispec import APISpec
+    from apispec.ext.marshmallow import MarshmallowPlugin
+
+    def _make_spec():
+        return APISpec(
+            title="Test API",
+            version="1.0.0",
+            openapi_version="3.0.0",
+            plugins=[MarshmallowPlugin()],
+        )
+
+    return _make_spec
+
+
+@pytest.fixture(scope="module")
+def shared_spec(make_spec):
+    """Module-wide APISpec for read-only tests that never register components."""
+    return make_spec()
+
+
 @pytest.fixture
-def spec():
-    """Create an APISpec instance with MarshmallowPlugin."""
-    return APISpec(
-        title="Test API",
-        version="1.0.0",
-        openapi_version="3.0.0",
-        plugins=[MarshmallowPlugin()],
-    )
+def spec(make_spec):
+    """Fresh APISpec for tests that register components or paths."""
+    return make_spec()
 
 
 class TestApispecBaseline:
     """Verify apispec works normally with native Marshmallow schemas."""
 
-    def test_apispec_initialization(self, spec):
+    def test_apispec_initialization(self, shared_spec):
         """APISpec initializes correctly."""
-        assert spec is not None
-        assert spec.title == "Test API"
-        assert spec.version == "1.0.0"
+        assert shared_spec is not None
+        assert shared_spec.title == "Test API"
+        assert shared_spec.version == "1.0.0"
 
     def test_native_schema_registration(self, spec):
         """Native Marshmallow schemas can be registered."""
@@ -252,6 +299,22 @@ class TestNestedSchemas:
         items_prop = order_schema["properties"]["items"]
         assert items_prop["type"] == "array"
 
+    def test_shared_nested_model_resolved_once(self, spec):
+        """A nested model referenced from several schemas yields one component."""
+        OrderSchema = schema_for(OrderPydantic)
+        OrderItemSchema = schema_for(OrderItemPydantic)
+
+        spec.components.schema("OrderItem", schema=OrderItemSchema)
+        spec.components.schema("Order", schema=OrderSchema)
+
+        openapi_spec = spec.to_dict()
+        schemas = openapi_spec["components"]["schemas"]
+        items_prop = schemas["Order"]["properties"]["items"]
+
+        # The nested field reuses the already-registered component via $ref
+        assert items_prop["items"] == {"$ref": "#/components/schemas/OrderItem"}
+        assert len(schemas) == 2
+
 
 class TestMultipleSchemas:
     """Test registering multiple schemas."""
@@ -262,9 +325,9 @@ class TestMultipleSchemas:
         ProductSchema = schema_for(ProductPydantic)
         OrderSchema = schema_for(OrderPydantic)
 
-        spec.components.schema("User", schema=UserSchema)
-        spec.components.schema("Product", schema=ProductSchema)
-        spec.components.schema("Order", schema=OrderSchema)
+        register_schemas(
+            spec, {"User": UserSchema, "Product": ProductSchema, "Order": OrderSchema}
+        )
 
         openapi_spec = spec.to_dict()
         schemas = openapi_spec["components"]["schemas"]
@@ -278,8 +341,7 @@ class TestMultipleSchemas:
         UserSchema = schema_for(UserPydantic)
         ProductSchema = schema_for(ProductPydantic)
 
-        spec.components.schema("User", schema=UserSchema)
-        spec.components.schema("Product", schema=ProductSchema)
+        register_schemas(spec, {"User": UserSchema, "Product": ProductSchema})
 
         openapi_spec = spec.to_dict()
         user_props = openapi_spec["components"]["schemas"]["User"]["properties"]
@@ -360,7 +422,7 @@ class TestSchemaInPaths:
 class TestSchemaAttributes:
     """Test that schema attributes work correctly."""
 
-    def test_schema_has_fields_attribute(self, spec):
+    def test_schema_has_fields_attribute(self):
         """PydanticSchema has fields attribute used by apispec."""
         UserSchema = schema_for(UserPydantic)
         schema = UserSchema()
@@ -396,6 +458,27 @@ class TestDescriptionHandling:
         # At minimum, the schema should be valid
         assert "properties" in user_schema
 
+    def test_field_metadata_converted_once_at_registration(self, spec, monkeypatch):
+        """Field metadata is converted on registration, not on every to_dict()."""
+        converter = spec.plugins[0].converter
+        original = converter.field2property
+        calls = []
+
+        def counting_field2property(field, *args, **kwargs):
+            calls.append(field)
+            return original(field, *args, **kwargs)
+
+        monkeypatch.setattr(converter, "field2property", counting_field2property)
+
+        spec.components.schema("User", schema=schema_for(UserPydantic))
+        converted = len(calls)
+        first = spec.to_dict()
+        second = spec.to_dict()
+
+        assert converted > 0
+        assert len(calls) == converted
+        assert first["components"]["schemas"]["User"] == second["components"]["schemas"]["User"]
+
 
 class TestCompleteAPISpec:
     """Test generating a complete API specification."""
@@ -407,9 +490,9 @@ class TestCompleteAPISpec:
         ProductSchema = schema_for(ProductPydantic)
         OrderSchema = schema_for(OrderPydantic)
 
-        spec.components.schema("User", schema=UserSchema)
-        spec.components.schema("Product", schema=ProductSchema)
-        spec.components.schema("Order", schema=OrderSchema)
+        register_schemas(
+            spec, {"User": UserSchema, "Product": ProductSchema, "Order": OrderSchema}
+        )
 
         # Add paths
         spec.path(
@@ -497,10 +580,6 @@ class TestEdgeCases:
 
     def test_empty_schema(self, spec):
         """Schema with minimal fields works."""
-
-        class MinimalModel(BaseModel):
-            name: str
-
         MinimalSchema = schema_for(MinimalModel)
         spec.components.schema("Minimal", schema=MinimalSchema)
 
@@ -509,11 +588,6 @@ class TestEdgeCases:
 
     def test_schema_with_optional_only(self, spec):
         """Schema with only optional fields works."""
-
-        class AllOptionalModel(BaseModel):
-            field1: str | None = None
-            field2: int | None = None
-
         AllOptionalSchema = schema_for(AllOptionalModel)
         spec.components.schema("AllOptional", schema=AllOptionalSchema)
 
@@ -525,16 +599,6 @@ class TestEdgeCases:
 
     def test_deeply_nested_schema(self, spec):
         """Deeply nested schemas work correctly."""
-
-        class Level3(BaseModel):
-            value: str
-
-        class Level2(BaseModel):
-            level3: Level3
-
-        class Level1(BaseModel):
-            level2: Level2
-
         Level1Schema = schema_for(Level1)
         spec.components.schema("Level1", schema=Level1Schema)
 
@@ -6,15 +6,21 @@ for request/response validation. This tests that PydanticSchema works
 correctly when registered with Connexion's schema resolvers.
 """
 
-import pytest
+import importlib.util
+import json
 
-connexion = pytest.importorskip("connexion")
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
 
-import json  # noqa: E402
+from pydantic_marshmallow import PydanticSchema, pydantic_schema, schema_for
 
-from pydantic import BaseModel, Field  # noqa: E402
+# Availability check only - nothing here uses connexion at import time,
+# so avoid paying its (heavy) import cost during collection
+CONNEXION_AVAILABLE = importlib.util.find_spec("connexion") is not None
 
-from pydantic_marshmallow import PydanticSchema, schema_for  # noqa: E402
+pytestmark = pytest.mark.skipif(
+    not CONNEXION_AVAILABLE, reason="connexion not installed"
+)
 
 # =============================================================================
 # Test Models
@@ -41,6 +47,8 @@ class CreateUserRequest(BaseModel):
 class UserResponse(BaseModel):
     """Response model for user data."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     email: str
@@ -50,10 +58,35 @@ class UserResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
+    model_config = ConfigDict(frozen=True)
+
     code: int
     message: str
 
 
+class Address(BaseModel):
+    """Address model for nested schema tests."""
+
+    street: str
+    city: str
+    zip_code: str
+
+
+class Person(BaseModel):
+    """Person with nested address."""
+
+    name: str
+    address: Address
+
+
+@pydantic_schema
+class Item(BaseModel):
+    """Item model exposing a ``.Schema`` attribute."""
+
+    name: str
+    price: float = Field(ge=0)
+
+
 # =============================================================================
 # Schemas
 # =============================================================================
@@ -219,6 +252,22 @@ class TestConnexionResponseSerialization:
         assert result[0]["id"] == 1
         assert result[1]["id"] == 2
 
+    def test_dump_same_frozen_response_twice(self):
+        """Re-dumping a frozen response yields an equal but independent dict."""
+        schema = UserResponseSchema(many=True)
+        response = UserResponse(id=7, name="Eve", email="eve@example.com", age=28)
+
+        first, second = schema.dump([response, response])
+        first["extra"] = "mutated by caller"
+
+        assert second == {
+            "id": 7,
+            "name": "Eve",
+            "email": "eve@example.com",
+            "age": 28,
+        }
+        assert first is not second
+
     def test_error_response_serialization(self):
         """Test error response serialization."""
         schema = ErrorResponseSchema()
@@ -247,13 +296,6 @@ class TestConnexionSchemaRegistry:
 
     def test_schema_as_class_attribute(self):
         """Test pattern where model has .Schema attribute."""
-        from pydantic_marshmallow import pydantic_schema
-
-        @pydantic_schema
-        class Item(BaseModel):
-            name: str
-            price: float = Field(ge=0)
-
         # Access schema via class attribute
         schema = Item.Schema()
         data = {"name": "Widget", "price": 9.99}
@@ -285,16 +327,6 @@ class TestConnexionOpenAPISpec:
 
     def test_nested_schema_compatibility(self):
         """Test nested models work with Connexion patterns."""
-
-        class Address(BaseModel):
-            street: str
-            city: str
-            zip_code: str
-
-        class Person(BaseModel):
-            name: str
-            address: Address
-
         person_schema_cls = schema_for(Person)
         schema = person_schema_cls()
 
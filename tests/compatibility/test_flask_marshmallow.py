@@ -7,18 +7,19 @@ in typical Flask application patterns.
 
 import pytest
 from marshmallow import Schema
-from pydantic import Field, field_validator
 
-from pydantic_marshmallow import schema_for
+from pydantic_marshmallow import BridgeValidationError, schema_for
 
 # Import shared models from compatibility conftest
-from .conftest import AddressPydantic, ProductPydantic, UserPydantic, UserWithAddressPydantic
+from .conftest import AddressPydantic, ProductPydantic, UserPydantic, UserWithAddressPydantic, json_of
 
 # Third-party imports with conditional availability
 try:
-    from flask import Flask, jsonify
+    from flask import Flask, jsonify, request
     from flask_marshmallow import Marshmallow
 
+    from .conftest import OrjsonProvider
+
     FLASK_MARSHMALLOW_AVAILABLE = True
 except ImportError:
     FLASK_MARSHMALLOW_AVAILABLE = False
@@ -29,18 +30,38 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
-def app():
-    """Create a Flask application for testing."""
+# Schemas are built once per module and shared read-only across tests
+UserSchema = schema_for(UserPydantic)
+UserWithAddressSchema = schema_for(UserWithAddressPydantic)
+ProductSchema = schema_for(ProductPydantic)
+
+
+@pytest.fixture(scope="module")
+def shared_app():
+    """Module-wide Flask app for tests that register no routes.
+
+    Flask rejects new routes once an app has handled a request, so tests
+    that add routes keep using the function-scoped ``app`` fixture.
+    """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config["TESTING"] = True
     return app
 
 
+@pytest.fixture(scope="module")
+def shared_ma(shared_app):
+    """Flask-Marshmallow bound once to the module-wide app."""
+    return Marshmallow(shared_app)
+
+
 @pytest.fixture
-def ma(app):
-    """Initialize Flask-Marshmallow with app."""
-    return Marshmallow(app)
+def app():
+    """Create a Flask application for testing."""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.config["TESTING"] = True
+    return app
 
 
 @pytest.fixture
@@ -52,17 +73,17 @@ def client(app):
 class TestFlaskMarshmallowBaseline:
     """Verify Flask-Marshmallow works normally (baseline)."""
 
-    def test_flask_marshmallow_initialization(self, app, ma):
+    def test_flask_marshmallow_initialization(self, shared_ma):
         """Flask-Marshmallow initializes correctly."""
-        assert ma is not None
-        assert hasattr(ma, "Schema")
+        assert shared_ma is not None
+        assert hasattr(shared_ma, "Schema")
 
-    def test_native_schema_registration(self, app, ma):
+    def test_native_schema_registration(self, shared_ma):
         """Native Marshmallow schemas work with Flask-Marshmallow."""
         from marshmallow import fields as ma_fields
 
         # Use explicit field declarations (works on both MA 3.x and 4.x)
-        class NativeUserSchema(ma.Schema):
+        class NativeUserSchema(shared_ma.Schema):
             id = ma_fields.Integer()
             name = ma_fields.String()
             email = ma_fields.String()
@@ -75,11 +96,9 @@ class TestFlaskMarshmallowBaseline:
 class TestPydanticSchemaWithFlask:
     """Test PydanticSchema works with Flask."""
 
-    def test_schema_for_with_flask_app(self, app):
+    def test_schema_for_with_flask_app(self, shared_app):
         """schema_for creates schemas usable in Flask context."""
-        UserSchema = schema_for(UserPydantic)
-
-        with app.app_context():
+        with shared_app.app_context():
             schema = UserSchema()
             user = schema.load(
                 {"name": "Test User", "email": "test@example.com", "age": 25}
@@ -91,37 +110,33 @@ class TestPydanticSchemaWithFlask:
 
     def test_json_serialization_in_flask(self, app, client):
         """PydanticSchema output is JSON-serializable for Flask responses."""
-        UserSchema = schema_for(UserPydantic)
+        schema = UserSchema()
 
         @app.route("/user")
         def get_user():
-            user = UserPydantic(
+            user = UserPydantic.model_construct(
                 id=1, name="Flask User", email="flask@example.com", age=30
             )
-            schema = UserSchema()
             return jsonify(schema.dump(user))
 
         response = client.get("/user")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "Flask User"
         assert data["email"] == "flask@example.com"
 
     def test_request_validation(self, app, client):
         """PydanticSchema validates incoming request data."""
-        UserSchema = schema_for(UserPydantic)
+        schema = UserSchema()
 
         @app.route("/users", methods=["POST"])
         def create_user():
-            from flask import request
-            from marshmallow import ValidationError
-
-            schema = UserSchema()
-            try:
-                user = schema.load(request.get_json())
-                return jsonify(schema.dump(user)), 201
-            except ValidationError as e:
-                return jsonify({"error": e.messages}), 400
+            # Validate-only: the payload is echoed back, so skip load + dump
+            payload = request.get_json()
+            errors = schema.validate(payload)
+            if errors:
+                return jsonify({"error": errors}), 400
+            return jsonify(payload), 201
 
         # Valid request
         response = client.post(
@@ -143,9 +158,8 @@ class TestPydanticSchemaWithFlask:
 class TestPydanticSchemaInheritance:
     """Test schema inheritance patterns with Flask-Marshmallow."""
 
-    def test_schema_is_marshmallow_schema(self, ma):
+    def test_schema_is_marshmallow_schema(self, shared_ma):
         """PydanticSchema is a proper Marshmallow Schema subclass."""
-        UserSchema = schema_for(UserPydantic)
         assert issubclass(UserSchema, Schema)
 
         schema = UserSchema()
@@ -153,8 +167,6 @@ class TestPydanticSchemaInheritance:
 
     def test_schema_has_expected_attributes(self):
         """PydanticSchema has all expected Marshmallow attributes."""
-        UserSchema = schema_for(UserPydantic)
-
         # Check class-level attributes
         assert hasattr(UserSchema, "Meta")
         assert hasattr(UserSchema, "_declared_fields")
@@ -165,7 +177,6 @@ class TestPydanticSchemaInheritance:
 
     def test_schema_meta_options(self):
         """Schema Meta options are accessible."""
-        UserSchema = schema_for(UserPydantic)
         assert hasattr(UserSchema, "Meta")
         assert hasattr(UserSchema.Meta, "model")
         assert UserSchema.Meta.model is UserPydantic
@@ -176,35 +187,32 @@ class TestNestedSchemas:
 
     def test_nested_model_serialization(self, app, client):
         """Nested Pydantic models serialize correctly."""
-        UserWithAddressSchema = schema_for(UserWithAddressPydantic)
+        schema = UserWithAddressSchema()
 
         @app.route("/user-with-address")
         def get_user_with_address():
-            user = UserWithAddressPydantic(
+            user = UserWithAddressPydantic.model_construct(
                 name="Nested User",
                 email="nested@example.com",
-                address=AddressPydantic(
+                address=AddressPydantic.model_construct(
                     street="123 Main St",
                     city="Boston",
                     country="USA",
                     zip_code="02101",
                 ),
             )
-            schema = UserWithAddressSchema()
             return jsonify(schema.dump(user))
 
         response = client.get("/user-with-address")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "Nested User"
         assert data["address"]["city"] == "Boston"
         assert data["address"]["zip_code"] == "02101"
 
-    def test_nested_model_deserialization(self, app):
+    def test_nested_model_deserialization(self, shared_app):
         """Nested Pydantic models deserialize correctly."""
-        UserWithAddressSchema = schema_for(UserWithAddressPydantic)
-
-        with app.app_context():
+        with shared_app.app_context():
             schema = UserWithAddressSchema()
             user = schema.load(
                 {
@@ -228,26 +236,23 @@ class TestListFields:
 
     def test_list_field_serialization(self, app, client):
         """List fields serialize correctly."""
-        ProductSchema = schema_for(ProductPydantic)
+        schema = ProductSchema()
 
         @app.route("/product")
         def get_product():
-            product = ProductPydantic(
+            product = ProductPydantic.model_construct(
                 id=1, name="Widget", price=19.99, tags=["sale", "featured", "new"]
             )
-            schema = ProductSchema()
             return jsonify(schema.dump(product))
 
         response = client.get("/product")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["tags"] == ["sale", "featured", "new"]
 
-    def test_list_field_deserialization(self, app):
+    def test_list_field_deserialization(self, shared_app):
         """List fields deserialize correctly."""
-        ProductSchema = schema_for(ProductPydantic)
-
-        with app.app_context():
+        with shared_app.app_context():
             schema = ProductSchema()
             product = schema.load(
                 {"name": "Gadget", "price": 29.99, "tags": ["electronics", "gadgets"]}
@@ -259,13 +264,9 @@ class TestListFields:
 class TestValidationInFlaskContext:
     """Test Pydantic validation works in Flask context."""
 
-    def test_field_validation_works(self, app):
+    def test_field_validation_works(self, shared_app):
         """Pydantic field validators run in Flask context."""
-        UserSchema = schema_for(UserPydantic)
-
-        from pydantic_marshmallow import BridgeValidationError
-
-        with app.app_context():
+        with shared_app.app_context():
             schema = UserSchema()
 
             # Valid data
@@ -278,13 +279,9 @@ class TestValidationInFlaskContext:
                     {"name": "User", "email": "user@example.com", "age": -5}
                 )
 
-    def test_custom_validator_works(self, app):
+    def test_custom_validator_works(self, shared_app):
         """Custom Pydantic validators run in Flask context."""
-        UserSchema = schema_for(UserPydantic)
-
-        from pydantic_marshmallow import BridgeValidationError
-
-        with app.app_context():
+        with shared_app.app_context():
             schema = UserSchema()
 
             # Name with only spaces should trigger custom validator
@@ -302,27 +299,27 @@ class TestMultipleSchemasInApp:
 
     def test_multiple_schemas_coexist(self, app, client):
         """Multiple PydanticSchema instances work together."""
-        UserSchema = schema_for(UserPydantic)
-        ProductSchema = schema_for(ProductPydantic)
+        user_schema = UserSchema()
+        product_schema = ProductSchema()
 
         @app.route("/user/<int:user_id>")
         def get_user(user_id):
-            user = UserPydantic(id=user_id, name="User", email="user@example.com")
-            return jsonify(UserSchema().dump(user))
+            user = UserPydantic.model_construct(id=user_id, name="User", email="user@example.com")
+            return jsonify(user_schema.dump(user))
 
         @app.route("/product/<int:product_id>")
         def get_product(product_id):
-            product = ProductPydantic(id=product_id, name="Product", price=9.99)
-            return jsonify(ProductSchema().dump(product))
+            product = ProductPydantic.model_construct(id=product_id, name="Product", price=9.99)
+            return jsonify(product_schema.dump(product))
 
         # Test both endpoints
         user_response = client.get("/user/1")
         assert user_response.status_code == 200
-        assert user_response.get_json()["id"] == 1
+        assert json_of(user_response)["id"] == 1
 
         product_response = client.get("/product/2")
         assert product_response.status_code == 200
-        assert product_response.get_json()["id"] == 2
+        assert json_of(product_response)["id"] == 2
 
 
 class TestErrorHandling:
@@ -330,15 +327,10 @@ class TestErrorHandling:
 
     def test_validation_error_response(self, app, client):
         """Validation errors can be properly formatted for API responses."""
-        UserSchema = schema_for(UserPydantic)
-
-        from pydantic_marshmallow import BridgeValidationError
+        schema = UserSchema()
 
         @app.route("/validate-user", methods=["POST"])
         def validate_user():
-            from flask import request
-
-            schema = UserSchema()
             try:
                 user = schema.load(request.get_json())
                 return jsonify(schema.dump(user))
@@ -354,6 +346,6 @@ class TestErrorHandling:
         )
 
         assert response.status_code == 422
-        data = response.get_json()
+        data = json_of(response)
         assert data["status"] == "error"
         assert "errors" in data
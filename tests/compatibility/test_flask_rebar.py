@@ -7,87 +7,45 @@ for building REST APIs with automatic Swagger/OpenAPI documentation.
 
 import pytest
 from marshmallow import Schema
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 from pydantic_marshmallow import schema_for
-from pydantic_marshmallow.bridge import _MARSHMALLOW_4_PLUS
+from pydantic_marshmallow.bridge import _MARSHMALLOW_4_PLUS, _parse_version
+
+from .conftest import (
+    DocumentedProductPydantic as ProductPydantic,
+    DocumentedUserCreatePydantic as UserCreatePydantic,
+    DocumentedUserPydantic as UserPydantic,
+    DocumentedUserUpdatePydantic as UserUpdatePydantic,
+    json_of,
+)
 
 # Third-party imports with conditional availability
 try:
     from importlib.metadata import version as get_version
 
     from flask import Flask
-    from flask_rebar import Rebar, ResponseSchema as RebarResponseSchema
+    from flask_rebar import Rebar, ResponseSchema as RebarResponseSchema, get_validated_body
     from flask_rebar.validation import RequestSchema
 
+    from .conftest import OrjsonProvider
+
     FLASK_REBAR_AVAILABLE = True
     # flask-rebar >= 3.4 supports marshmallow 4.x swagger generation
-    _flask_rebar_version = tuple(int(x) for x in get_version("flask-rebar").split(".")[:2])
-    FLASK_REBAR_MA4_COMPATIBLE = _flask_rebar_version >= (3, 4)
+    FLASK_REBAR_MA4_COMPATIBLE = _parse_version(get_version("flask-rebar")) >= (3, 4)
 except ImportError:
     FLASK_REBAR_AVAILABLE = False
     FLASK_REBAR_MA4_COMPATIBLE = False
 
+# Swagger generation on marshmallow 4.x needs flask-rebar >= 3.4
+_SKIP_SWAGGER = _MARSHMALLOW_4_PLUS and not FLASK_REBAR_MA4_COMPATIBLE
+
 pytestmark = pytest.mark.skipif(
     not FLASK_REBAR_AVAILABLE, reason="flask-rebar not installed"
 )
 
 
 # Pydantic models for testing
-class UserPydantic(BaseModel):
-    """User model for API."""
-
-    id: int | None = Field(default=None, description="User ID")
-    name: str = Field(min_length=1, max_length=100, description="User's full name")
-    email: str = Field(
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$", description="User's email address"
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
-
-    @field_validator("name")
-    @classmethod
-    def name_must_not_be_empty(cls, v: str) -> str:
-        if v.strip() == "":
-            raise ValueError("Name cannot be blank")
-        return v.strip()
-
-
-class UserCreatePydantic(BaseModel):
-    """User creation request model."""
-
-    name: str = Field(min_length=1, max_length=100, description="User's full name")
-    email: str = Field(
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$", description="User's email address"
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
-
-
-class UserUpdatePydantic(BaseModel):
-    """User update request model (partial)."""
-
-    name: str | None = Field(
-        default=None, min_length=1, max_length=100, description="User's full name"
-    )
-    email: str | None = Field(
-        default=None,
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$",
-        description="User's email address",
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
-
-
-class ProductPydantic(BaseModel):
-    """Product model for API."""
-
-    id: int | None = Field(default=None, description="Product ID")
-    name: str = Field(min_length=1, max_length=200, description="Product name")
-    price: float = Field(gt=0, description="Product price")
-    description: str | None = Field(
-        default=None, max_length=1000, description="Product description"
-    )
-    tags: list[str] = Field(default_factory=list, description="Product tags")
-
-
 class SearchQueryPydantic(BaseModel):
     """Search query parameters."""
 
@@ -96,15 +54,24 @@ class SearchQueryPydantic(BaseModel):
     offset: int = Field(default=0, ge=0, description="Results offset")
 
 
+# Schemas are built once per module and shared read-only across tests
+UserSchema = schema_for(UserPydantic)
+UserCreateSchema = schema_for(UserCreatePydantic)
+ProductSchema = schema_for(ProductPydantic)
+UserUpdateSchema = schema_for(UserUpdatePydantic)
+
+
 # Flask fixtures (app, client) provided by conftest.py
 
 
 @pytest.fixture
 def rebar(app):
-    """Create a Rebar instance."""
-    rebar = Rebar()
-    rebar.init_app(app)
-    return rebar
+    """Create a Rebar instance.
+
+    Tests call ``rebar.init_app(app)`` once, after registering their
+    handlers, so the routes and swagger spec are built a single time.
+    """
+    return Rebar()
 
 
 @pytest.fixture
@@ -124,6 +91,7 @@ class TestFlaskRebarBaseline:
 
     def test_rebar_initialization(self, app, rebar):
         """Flask-Rebar initializes correctly."""
+        rebar.init_app(app)
         assert rebar is not None
 
     def test_native_schema_with_rebar(self, app, rebar, registry, client):
@@ -147,7 +115,7 @@ class TestFlaskRebarBaseline:
 
         response = client.get("/native-users")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "Native User"
 
 
@@ -156,46 +124,43 @@ class TestPydanticSchemaWithRebar:
 
     def test_response_schema(self, app, rebar, registry, client):
         """PydanticSchema works as response schema."""
-        UserSchema = schema_for(UserPydantic)
+        user_schema = UserSchema()
 
         @registry.handles(
             rule="/users/<int:user_id>",
             method="GET",
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def get_user(user_id):
-            user = UserPydantic(
+            user = UserPydantic.model_construct(
                 id=user_id, name="Test User", email="test@example.com", age=25
             )
-            return UserSchema().dump(user)
+            return user_schema.dump(user)
 
         rebar.init_app(app)
 
         response = client.get("/users/1")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["id"] == 1
         assert data["name"] == "Test User"
         assert data["email"] == "test@example.com"
 
     def test_request_body_schema(self, app, rebar, registry, client):
         """PydanticSchema works as request body schema."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-        UserSchema = schema_for(UserPydantic)
+        user_schema = UserSchema()
 
         @registry.handles(
             rule="/users",
             method="POST",
             request_body_schema=UserCreateSchema(),
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def create_user():
-            from flask_rebar import get_validated_body
-
             body = get_validated_body()
             # body is a Pydantic model instance
-            user = UserPydantic(id=1, name=body.name, email=body.email, age=body.age)
-            return UserSchema().dump(user)
+            user = UserPydantic(id=1, **body.model_dump())
+            return user_schema.dump(user)
 
         rebar.init_app(app)
 
@@ -205,7 +170,7 @@ class TestPydanticSchemaWithRebar:
             content_type="application/json",
         )
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "New User"
         assert data["email"] == "new@example.com"
 
@@ -213,9 +178,14 @@ class TestPydanticSchemaWithRebar:
 class TestRequestValidation:
     """Test request validation with flask-rebar."""
 
-    def test_invalid_request_body(self, app, rebar, registry, client):
-        """Invalid request bodies are rejected."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
+    @pytest.fixture(scope="class")
+    def validation_client(self):
+        """One app and one validated route shared by every payload below."""
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+        app.config["TESTING"] = True
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
 
         @registry.handles(
             rule="/users-validated",
@@ -226,65 +196,29 @@ class TestRequestValidation:
             return {"status": "created"}
 
         rebar.init_app(app)
-
-        # Empty name should fail validation
-        response = client.post(
+        return app.test_client()
+
+    @pytest.mark.parametrize(
+        "payload,expected_statuses",
+        [
+            ({"name": "", "email": "test@example.com"}, (400, 422)),
+            ({"name": "Test User"}, (400, 422)),
+            ({"name": "Valid Name", "email": "valid@example.com"}, (200,)),
+        ],
+        ids=["invalid_request_body", "missing_required_field", "valid_request_body"],
+    )
+    def test_request_body_validation(self, validation_client, payload, expected_statuses):
+        """Request bodies are validated by PydanticSchema before the handler runs."""
+        response = validation_client.post(
             "/users-validated",
-            json={"name": "", "email": "test@example.com"},
-            content_type="application/json",
-        )
-        assert response.status_code in (400, 422)  # Validation error
-
-    def test_missing_required_field(self, app, rebar, registry, client):
-        """Missing required fields are caught."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-
-        @registry.handles(
-            rule="/users-required",
-            method="POST",
-            request_body_schema=UserCreateSchema(),
-        )
-        def create_user_required():
-            return {"status": "created"}
-
-        rebar.init_app(app)
-
-        # Missing email should fail
-        response = client.post(
-            "/users-required",
-            json={"name": "Test User"},
+            json=payload,
             content_type="application/json",
         )
-        assert response.status_code in (400, 422)
-
-    def test_custom_validator_runs(self, app, rebar, registry, client):
-        """Custom Pydantic validators run through flask-rebar."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-
-        @registry.handles(
-            rule="/users-custom-validation",
-            method="POST",
-            request_body_schema=UserCreateSchema(),
-        )
-        def create_user_custom():
-            return {"status": "created"}
-
-        rebar.init_app(app)
-
-        # Name with only whitespace should fail custom validator
-        # (from name_must_not_be_empty in UserPydantic, inherited through validation)
-        # Note: Since UserCreatePydantic doesn't have the validator, this tests
-        # that base validation still works
-        response = client.post(
-            "/users-custom-validation",
-            json={"name": "Valid Name", "email": "valid@example.com"},
-            content_type="application/json",
-        )
-        assert response.status_code == 200
+        assert response.status_code in expected_statuses
 
 
 @pytest.mark.skipif(
-    _MARSHMALLOW_4_PLUS and not FLASK_REBAR_MA4_COMPATIBLE,
+    _SKIP_SWAGGER,
     reason="flask-rebar < 3.4 does not support marshmallow 4.x swagger generation",
 )
 class TestSwaggerGeneration:
@@ -292,8 +226,6 @@ class TestSwaggerGeneration:
 
     def test_swagger_endpoint_available(self, app, rebar, registry, client):
         """Swagger endpoint is available."""
-        UserSchema = schema_for(UserPydantic)
-
         @registry.handles(
             rule="/swagger-users",
             method="GET",
@@ -311,8 +243,6 @@ class TestSwaggerGeneration:
 
     def test_schema_in_swagger_spec(self, app, rebar, registry, client):
         """PydanticSchema appears in Swagger spec."""
-        UserSchema = schema_for(UserPydantic)
-
         @registry.handles(
             rule="/spec-users",
             method="GET",
@@ -326,7 +256,7 @@ class TestSwaggerGeneration:
         # Get the swagger spec
         response = client.get("/swagger/swagger.json")
         if response.status_code == 200:
-            spec = response.get_json()
+            spec = json_of(response)
             # Verify paths exist
             assert "paths" in spec
             assert "/spec-users" in spec["paths"]
@@ -337,43 +267,43 @@ class TestMultipleEndpoints:
 
     def test_multiple_schemas_in_api(self, app, rebar, registry, client):
         """Multiple PydanticSchema schemas work in same API."""
-        UserSchema = schema_for(UserPydantic)
-        ProductSchema = schema_for(ProductPydantic)
+        user_schema = UserSchema()
+        product_schema = ProductSchema()
 
         @registry.handles(
             rule="/multi-users/<int:user_id>",
             method="GET",
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def get_multi_user(user_id):
-            user = UserPydantic(id=user_id, name="User", email="user@example.com")
-            return UserSchema().dump(user)
+            user = UserPydantic.model_construct(id=user_id, name="User", email="user@example.com")
+            return user_schema.dump(user)
 
         @registry.handles(
             rule="/multi-products/<int:product_id>",
             method="GET",
-            response_body_schema=ProductSchema(),
+            response_body_schema=product_schema,
         )
         def get_multi_product(product_id):
-            product = ProductPydantic(
+            product = ProductPydantic.model_construct(
                 id=product_id,
                 name="Product",
                 price=29.99,
                 tags=["electronics"],
             )
-            return ProductSchema().dump(product)
+            return product_schema.dump(product)
 
         rebar.init_app(app)
 
         # Test user endpoint
         user_response = client.get("/multi-users/1")
         assert user_response.status_code == 200
-        assert user_response.get_json()["name"] == "User"
+        assert json_of(user_response)["name"] == "User"
 
         # Test product endpoint
         product_response = client.get("/multi-products/1")
         assert product_response.status_code == 200
-        assert product_response.get_json()["name"] == "Product"
+        assert json_of(product_response)["name"] == "Product"
 
 
 class TestSchemaCompatibility:
@@ -381,7 +311,6 @@ class TestSchemaCompatibility:
 
     def test_schema_is_marshmallow_schema(self):
         """PydanticSchema is a proper Marshmallow Schema subclass."""
-        UserSchema = schema_for(UserPydantic)
         assert issubclass(UserSchema, Schema)
 
         schema = UserSchema()
@@ -389,7 +318,6 @@ class TestSchemaCompatibility:
 
     def test_schema_has_required_attributes(self):
         """PydanticSchema has attributes required by flask-rebar."""
-        UserSchema = schema_for(UserPydantic)
         schema = UserSchema()
 
         # flask-rebar uses these attributes
@@ -404,9 +332,7 @@ class TestCRUDOperations:
 
     def test_full_crud_workflow(self, app, rebar, registry, client):
         """Full CRUD workflow works with PydanticSchema."""
-        UserSchema = schema_for(UserPydantic)
-        UserCreateSchema = schema_for(UserCreatePydantic)
-        UserUpdateSchema = schema_for(UserUpdatePydantic)
+        user_schema = UserSchema()
 
         # Simple in-memory store for testing
         users_store = {}
@@ -415,47 +341,41 @@ class TestCRUDOperations:
             rule="/crud-users",
             method="POST",
             request_body_schema=UserCreateSchema(),
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def create_crud_user():
-            from flask_rebar import get_validated_body
-
             body = get_validated_body()
             user_id = len(users_store) + 1
-            user = UserPydantic(id=user_id, name=body.name, email=body.email, age=body.age)
+            user = UserPydantic(id=user_id, **body.model_dump())
             users_store[user_id] = user
-            return UserSchema().dump(user)
+            return user_schema.dump(user)
 
         @registry.handles(
             rule="/crud-users/<int:user_id>",
             method="GET",
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def get_crud_user(user_id):
             user = users_store.get(user_id)
             if user:
-                return UserSchema().dump(user)
+                return user_schema.dump(user)
             return {"error": "Not found"}, 404
 
         @registry.handles(
             rule="/crud-users/<int:user_id>",
             method="PATCH",
             request_body_schema=UserUpdateSchema(),
-            response_body_schema=UserSchema(),
+            response_body_schema=user_schema,
         )
         def update_crud_user(user_id):
-            from flask_rebar import get_validated_body
-
             body = get_validated_body()
             user = users_store.get(user_id)
             if user:
-                # Update only provided fields
+                # Update only provided fields; body was already validated
                 update_data = body.model_dump(exclude_unset=True)
-                user_dict = user.model_dump()
-                user_dict.update(update_data)
-                updated_user = UserPydantic(**user_dict)
+                updated_user = user.model_copy(update=update_data)
                 users_store[user_id] = updated_user
-                return UserSchema().dump(updated_user)
+                return user_schema.dump(updated_user)
             return {"error": "Not found"}, 404
 
         rebar.init_app(app)
@@ -467,13 +387,13 @@ class TestCRUDOperations:
             content_type="application/json",
         )
         assert create_response.status_code == 200
-        created_user = create_response.get_json()
+        created_user = json_of(create_response)
         user_id = created_user["id"]
 
         # Read
         get_response = client.get(f"/crud-users/{user_id}")
         assert get_response.status_code == 200
-        assert get_response.get_json()["name"] == "CRUD User"
+        assert json_of(get_response)["name"] == "CRUD User"
 
         # Update
         update_response = client.patch(
@@ -482,5 +402,6 @@ class TestCRUDOperations:
             content_type="application/json",
         )
         assert update_response.status_code == 200
-        assert update_response.get_json()["name"] == "Updated User"
-        assert update_response.get_json()["email"] == "crud@example.com"  # Unchanged
+        updated_user = json_of(update_response)
+        assert updated_user["name"] == "Updated User"
+        assert updated_user["email"] == "crud@example.com"  # Unchanged
@@ -5,82 +5,34 @@ Verifies that PydanticSchema works correctly with flask-smorest
 for building REST APIs with automatic OpenAPI documentation.
 """
 
+import orjson
 import pytest
-from marshmallow import Schema
+from marshmallow import Schema, ValidationError
 from pydantic import BaseModel, Field, field_validator
 
 from pydantic_marshmallow import schema_for
 
-# Third-party imports with conditional availability
-try:
-    from flask import Flask
-    from flask.views import MethodView
-    from flask_smorest import Api, Blueprint
-
-    FLASK_SMOREST_AVAILABLE = True
-except ImportError:
-    FLASK_SMOREST_AVAILABLE = False
-
-pytestmark = pytest.mark.skipif(
-    not FLASK_SMOREST_AVAILABLE, reason="flask-smorest not installed"
+from .conftest import (
+    DocumentedProductPydantic as ProductPydantic,
+    DocumentedUserCreatePydantic as UserCreatePydantic,
+    DocumentedUserPydantic as UserPydantic,
+    DocumentedUserUpdatePydantic as UserUpdatePydantic,
+    json_of,
 )
 
+# Skips the whole module at collection when flask-smorest is missing
+flask_smorest = pytest.importorskip("flask_smorest", reason="flask-smorest not installed")
 
-# Pydantic models for testing
-class UserPydantic(BaseModel):
-    """User model for API."""
-
-    id: int | None = Field(default=None, description="User ID")
-    name: str = Field(min_length=1, max_length=100, description="User's full name")
-    email: str = Field(
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$", description="User's email address"
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
+from flask import Flask  # noqa: E402
+from flask.views import MethodView  # noqa: E402
 
-    @field_validator("name")
-    @classmethod
-    def name_must_not_be_empty(cls, v: str) -> str:
-        if v.strip() == "":
-            raise ValueError("Name cannot be blank")
-        return v.strip()
-
-
-class UserCreatePydantic(BaseModel):
-    """User creation request model."""
-
-    name: str = Field(min_length=1, max_length=100, description="User's full name")
-    email: str = Field(
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$", description="User's email address"
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
+from .conftest import OrjsonProvider  # noqa: E402
 
-
-class UserUpdatePydantic(BaseModel):
-    """User update request model (partial)."""
-
-    name: str | None = Field(
-        default=None, min_length=1, max_length=100, description="User's full name"
-    )
-    email: str | None = Field(
-        default=None,
-        pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$",
-        description="User's email address",
-    )
-    age: int | None = Field(default=None, ge=0, le=150, description="User's age")
-
-
-class ProductPydantic(BaseModel):
-    """Product model for API."""
-
-    id: int | None = Field(default=None, description="Product ID")
-    name: str = Field(min_length=1, max_length=200, description="Product name")
-    price: float = Field(gt=0, description="Product price")
-    description: str | None = Field(
-        default=None, max_length=1000, description="Product description"
-    )
-    tags: list[str] = Field(default_factory=list, description="Product tags")
+Api = flask_smorest.Api
+Blueprint = flask_smorest.Blueprint
 
 
+# Pydantic models for testing
 class QueryArgsPydantic(BaseModel):
     """Query parameters for list endpoints."""
 
@@ -91,10 +43,30 @@ class QueryArgsPydantic(BaseModel):
     )
 
 
-@pytest.fixture
-def app():
-    """Create a Flask application for testing."""
+# Schemas are built once per module and shared read-only across tests
+UserSchema = schema_for(UserPydantic)
+UserCreateSchema = schema_for(UserCreatePydantic)
+ProductSchema = schema_for(ProductPydantic)
+QueryArgsSchema = schema_for(QueryArgsPydantic)
+
+# Shared many=True instance for list responses; handlers return models and
+# let @blp.response do the single dump
+USERS_SCHEMA = UserSchema(many=True)
+
+# POST body shared by the create endpoints, encoded once
+NEW_USER_BODY = orjson.dumps({"name": "New User", "email": "new@example.com", "age": 30})
+
+# Fixed payload for the MethodView list endpoint, validated once at import
+METHOD_VIEW_USERS = [
+    UserPydantic(id=1, name="User 1", email="user1@example.com"),
+    UserPydantic(id=2, name="User 2", email="user2@example.com"),
+]
+
+
+def _create_app():
+    """Create a Flask application configured for flask-smorest."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config["TESTING"] = True
     app.config["API_TITLE"] = "Test API"
     app.config["API_VERSION"] = "v1"
@@ -107,6 +79,12 @@ def app():
     return app
 
 
+@pytest.fixture
+def app():
+    """Create a Flask application for testing."""
+    return _create_app()
+
+
 @pytest.fixture
 def api(app):
     """Create a flask-smorest Api instance."""
@@ -146,40 +124,16 @@ class TestFlaskSmorestBaseline:
 
         response = client.get("/native-users/")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "Native User"
 
 
+@pytest.mark.xdist_group(name="flask_smorest_pydantic_schema_with_smorest")
 class TestPydanticSchemaWithSmorest:
     """Test PydanticSchema works with flask-smorest."""
 
-    def test_response_schema(self, app, api, client):
-        """PydanticSchema works as response schema."""
-        UserSchema = schema_for(UserPydantic)
-
-        blp = Blueprint("response_users", __name__, url_prefix="/response-users")
-
-        @blp.route("/<int:user_id>")
-        @blp.response(200, UserSchema)
-        def get_user(user_id):
-            user = UserPydantic(
-                id=user_id, name="Test User", email="test@example.com", age=25
-            )
-            return UserSchema().dump(user)
-
-        api.register_blueprint(blp)
-
-        response = client.get("/response-users/1")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["id"] == 1
-        assert data["name"] == "Test User"
-
     def test_request_body_schema(self, app, api, client):
         """PydanticSchema works as request body schema."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-        UserSchema = schema_for(UserPydantic)
-
         blp = Blueprint("request_users", __name__, url_prefix="/request-users")
 
         @blp.post("/")
@@ -187,39 +141,34 @@ class TestPydanticSchemaWithSmorest:
         @blp.response(201, UserSchema)
         def create_user(data):
             # data is a Pydantic model instance
-            user = UserPydantic(id=1, name=data.name, email=data.email, age=data.age)
-            return UserSchema().dump(user)
+            user = UserPydantic(id=1, **data.model_dump())
+            return user
 
         api.register_blueprint(blp)
 
         response = client.post(
             "/request-users/",
-            json={"name": "New User", "email": "new@example.com", "age": 30},
+            data=NEW_USER_BODY,
             content_type="application/json",
         )
         assert response.status_code == 201
-        data = response.get_json()
+        data = json_of(response)
         assert data["name"] == "New User"
 
     def test_query_args_schema(self, app, api, client):
         """PydanticSchema works for query arguments."""
-        QueryArgsSchema = schema_for(QueryArgsPydantic)
-        UserSchema = schema_for(UserPydantic)
-
         blp = Blueprint("query_users", __name__, url_prefix="/query-users")
 
         @blp.route("/")
         @blp.arguments(QueryArgsSchema, location="query")
-        @blp.response(200, UserSchema(many=True))
+        @blp.response(200, USERS_SCHEMA)
         def list_users(args):
             # args is a Pydantic model instance
             return [
-                UserSchema().dump(
-                    UserPydantic(
-                        id=i,
-                        name=f"User {i}",
-                        email=f"user{i}@example.com",
-                    )
+                UserPydantic.model_construct(
+                    id=i,
+                    name=f"User {i}",
+                    email=f"user{i}@example.com",
                 )
                 for i in range(args.page, args.page + args.per_page)
             ]
@@ -228,17 +177,19 @@ class TestPydanticSchemaWithSmorest:
 
         response = client.get("/query-users/?page=1&per_page=5")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert len(data) == 5
 
 
+@pytest.mark.xdist_group(name="flask_smorest_request_validation")
 class TestRequestValidation:
     """Test request validation with flask-smorest."""
 
-    def test_invalid_request_body(self, app, api, client):
-        """Invalid request bodies are rejected."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-
+    @pytest.fixture(scope="class")
+    def validation_client(self):
+        """One app and one validated blueprint for the HTTP-level check."""
+        app = _create_app()
+        api = Api(app)
         blp = Blueprint("valid_users", __name__, url_prefix="/valid-users")
 
         @blp.post("/")
@@ -248,185 +199,146 @@ class TestRequestValidation:
             return {"status": "created"}
 
         api.register_blueprint(blp)
+        return app.test_client()
 
+    def test_invalid_request_body(self, validation_client):
+        """Invalid request bodies are rejected."""
         # Empty name should fail validation
-        response = client.post(
+        response = validation_client.post(
             "/valid-users/",
             json={"name": "", "email": "test@example.com"},
             content_type="application/json",
         )
         assert response.status_code == 422  # Validation error
 
-    def test_missing_required_field(self, app, api, client):
-        """Missing required fields are caught."""
-        UserCreateSchema = schema_for(UserCreatePydantic)
-
-        blp = Blueprint("required_users", __name__, url_prefix="/required-users")
-
-        @blp.post("/")
-        @blp.arguments(UserCreateSchema)
-        @blp.response(201)
-        def create_user_required(data):
-            return {"status": "created"}
-
-        api.register_blueprint(blp)
+    # The 422 mapping is covered above; the checks below only exercise the
+    # schema, so they call load() directly instead of going through Flask.
 
+    def test_missing_required_field(self):
+        """Missing required fields are caught."""
         # Missing email should fail
-        response = client.post(
-            "/required-users/",
-            json={"name": "Test User"},
-            content_type="application/json",
-        )
-        assert response.status_code == 422
+        with pytest.raises(ValidationError) as exc_info:
+            UserCreateSchema().load({"name": "Test User"})
+        assert "email" in exc_info.value.messages
 
-    def test_constraint_validation(self, app, api, client):
+    def test_constraint_validation(self):
         """Pydantic constraints are enforced."""
-        QueryArgsSchema = schema_for(QueryArgsPydantic)
-
-        blp = Blueprint("constraint_users", __name__, url_prefix="/constraint-users")
+        # per_page > 100 should fail
+        with pytest.raises(ValidationError) as exc_info:
+            QueryArgsSchema().load({"per_page": 500})
+        assert "per_page" in exc_info.value.messages
 
-        @blp.route("/")
-        @blp.arguments(QueryArgsSchema, location="query")
-        @blp.response(200)
-        def list_users_constrained(args):
-            return {"page": args.page}
 
-        api.register_blueprint(blp)
+@pytest.mark.xdist_group(name="flask_smorest_registered_api")
+class TestRegisteredApi:
+    """GET responses, ETag and OpenAPI output from one registered Api."""
 
-        # per_page > 100 should fail
-        response = client.get("/constraint-users/?per_page=500")
-        assert response.status_code == 422
+    @pytest.fixture(scope="class")
+    def responses(self):
+        """Register user and product blueprints once and fetch each endpoint once."""
+        app = _create_app()
+        api = Api(app)
+        users_blp = Blueprint("users", __name__, url_prefix="/users")
+        products_blp = Blueprint("products", __name__, url_prefix="/products")
 
+        # Note: @blp.etag must be OUTER decorator (before @blp.response)
+        # so it runs after response wrapper sets appcontext["result_dump"]
+        @users_blp.route("/<int:user_id>")
+        @users_blp.etag
+        @users_blp.response(200, UserSchema)
+        def get_user(user_id):
+            # Return model instance - let flask-smorest handle serialization
+            return UserPydantic.model_construct(
+                id=user_id, name="Test User", email="test@example.com", age=25
+            )
 
-class TestOpenAPIGeneration:
-    """Test OpenAPI generation with flask-smorest."""
+        @products_blp.route("/<int:product_id>")
+        @products_blp.response(200, ProductSchema)
+        def get_product(product_id):
+            return ProductPydantic.model_construct(
+                id=product_id, name="Product", price=29.99, tags=["electronics"]
+            )
 
-    def test_openapi_spec_available(self, app, api, client):
-        """OpenAPI spec endpoint is available."""
-        UserSchema = schema_for(UserPydantic)
+        api.register_blueprint(users_blp)
+        api.register_blueprint(products_blp)
 
-        blp = Blueprint("spec_users", __name__, url_prefix="/spec-users")
+        client = app.test_client()
+        return {
+            "user": client.get("/users/1"),
+            "product": client.get("/products/2"),
+            "openapi": client.get("/openapi.json"),
+        }
 
-        @blp.route("/")
-        @blp.response(200, UserSchema)
-        def get_spec_user():
-            return {"id": 1, "name": "User", "email": "user@example.com"}
+    def test_response_schema(self, responses):
+        """PydanticSchema works as response schema."""
+        response = responses["user"]
+        assert response.status_code == 200
+        data = json_of(response)
+        assert data["id"] == 1
+        assert data["name"] == "Test User"
 
-        api.register_blueprint(blp)
+    def test_etag_with_pydantic_schema(self, responses):
+        """ETag works with PydanticSchema responses."""
+        assert "ETag" in responses["user"].headers
 
-        # Check openapi.json endpoint
-        response = client.get("/openapi.json")
+    def test_multiple_blueprints_in_api(self, responses):
+        """Multiple blueprints with PydanticSchema work together."""
+        response = responses["product"]
         assert response.status_code == 200
+        data = json_of(response)
+        assert data["id"] == 2
+        assert data["name"] == "Product"
 
-        spec = response.get_json()
+    def test_openapi_spec_available(self, responses):
+        """OpenAPI spec endpoint is available."""
+        response = responses["openapi"]
+        assert response.status_code == 200
+        spec = json_of(response)
         assert "openapi" in spec
         assert "paths" in spec
 
-    def test_schema_in_openapi_spec(self, app, api, client):
+    def test_schema_in_openapi_spec(self, responses):
         """PydanticSchema appears in OpenAPI spec."""
-        UserSchema = schema_for(UserPydantic)
-
-        blp = Blueprint("schema_users", __name__, url_prefix="/schema-users")
-
-        @blp.route("/")
-        @blp.response(200, UserSchema)
-        def get_schema_user():
-            return {"id": 1, "name": "User", "email": "user@example.com"}
-
-        api.register_blueprint(blp)
-
-        response = client.get("/openapi.json")
-        spec = response.get_json()
-
-        # Verify paths exist
-        assert "/schema-users/" in spec["paths"]
+        paths = json_of(responses["openapi"])["paths"]
+        assert "/users/{user_id}" in paths
+        assert "/products/{product_id}" in paths
 
 
+@pytest.mark.xdist_group(name="flask_smorest_method_view")
 class TestMethodView:
     """Test MethodView support with flask-smorest."""
 
     def test_method_view_with_pydantic_schema(self, app, api, client):
         """PydanticSchema works with MethodView."""
-        UserSchema = schema_for(UserPydantic)
-        UserCreateSchema = schema_for(UserCreatePydantic)
-
         blp = Blueprint("method_users", __name__, url_prefix="/method-users")
 
         @blp.route("/")
         class UserCollection(MethodView):
-            @blp.response(200, UserSchema(many=True))
+            @blp.response(200, USERS_SCHEMA)
             def get(self):
-                return [
-                    UserSchema().dump(
-                        UserPydantic(id=1, name="User 1", email="user1@example.com")
-                    ),
-                    UserSchema().dump(
-                        UserPydantic(id=2, name="User 2", email="user2@example.com")
-                    ),
-                ]
+                return METHOD_VIEW_USERS
 
             @blp.arguments(UserCreateSchema)
             @blp.response(201, UserSchema)
             def post(self, data):
-                user = UserPydantic(id=3, name=data.name, email=data.email, age=data.age)
-                return UserSchema().dump(user)
+                user = UserPydantic(id=3, **data.model_dump())
+                return user
 
         api.register_blueprint(blp)
 
         # Test GET
         get_response = client.get("/method-users/")
         assert get_response.status_code == 200
-        assert len(get_response.get_json()) == 2
+        assert len(json_of(get_response)) == 2
 
         # Test POST
         post_response = client.post(
             "/method-users/",
-            json={"name": "New User", "email": "new@example.com"},
+            data=NEW_USER_BODY,
             content_type="application/json",
         )
         assert post_response.status_code == 201
-        assert post_response.get_json()["name"] == "New User"
-
-
-class TestMultipleBlueprints:
-    """Test multiple blueprints with different schemas."""
-
-    def test_multiple_blueprints_in_api(self, app, api, client):
-        """Multiple blueprints with PydanticSchema work together."""
-        UserSchema = schema_for(UserPydantic)
-        ProductSchema = schema_for(ProductPydantic)
-
-        users_blp = Blueprint("multi_users", __name__, url_prefix="/multi-users")
-        products_blp = Blueprint(
-            "multi_products", __name__, url_prefix="/multi-products"
-        )
-
-        @users_blp.route("/<int:user_id>")
-        @users_blp.response(200, UserSchema)
-        def get_multi_user(user_id):
-            user = UserPydantic(id=user_id, name="User", email="user@example.com")
-            return UserSchema().dump(user)
-
-        @products_blp.route("/<int:product_id>")
-        @products_blp.response(200, ProductSchema)
-        def get_multi_product(product_id):
-            product = ProductPydantic(
-                id=product_id, name="Product", price=29.99, tags=["electronics"]
-            )
-            return ProductSchema().dump(product)
-
-        api.register_blueprint(users_blp)
-        api.register_blueprint(products_blp)
-
-        # Test user endpoint
-        user_response = client.get("/multi-users/1")
-        assert user_response.status_code == 200
-        assert user_response.get_json()["name"] == "User"
-
-        # Test product endpoint
-        product_response = client.get("/multi-products/1")
-        assert product_response.status_code == 200
-        assert product_response.get_json()["name"] == "Product"
+        assert json_of(post_response)["name"] == "New User"
 
 
 class TestSchemaCompatibility:
@@ -434,7 +346,6 @@ class TestSchemaCompatibility:
 
     def test_schema_is_marshmallow_schema(self):
         """PydanticSchema is a proper Marshmallow Schema subclass."""
-        UserSchema = schema_for(UserPydantic)
         assert issubclass(UserSchema, Schema)
 
         schema = UserSchema()
@@ -442,7 +353,6 @@ class TestSchemaCompatibility:
 
     def test_schema_has_required_attributes(self):
         """PydanticSchema has attributes required by flask-smorest."""
-        UserSchema = schema_for(UserPydantic)
         schema = UserSchema()
 
         # flask-smorest uses these attributes
@@ -450,33 +360,3 @@ class TestSchemaCompatibility:
         assert hasattr(schema, "load")
         assert hasattr(schema, "dump")
         assert hasattr(schema, "Meta")
-
-
-class TestETagSupport:
-    """Test ETag support with flask-smorest."""
-
-    def test_etag_with_pydantic_schema(self, app, api, client):
-        """ETag works with PydanticSchema responses."""
-        UserSchema = schema_for(UserPydantic)
-
-        blp = Blueprint(
-            "etag_users", __name__, url_prefix="/etag-users", description="ETag test"
-        )
-
-        # Note: @blp.etag must be OUTER decorator (before @blp.response)
-        # so it runs after response wrapper sets appcontext["result_dump"]
-        @blp.route("/<int:user_id>")
-        @blp.etag
-        @blp.response(200, UserSchema)
-        def get_etag_user(user_id):
-            # Return model instance - let flask-smorest handle serialization
-            return UserPydantic(
-                id=user_id, name="ETag User", email="etag@example.com"
-            )
-
-        api.register_blueprint(blp)
-
-        response = client.get("/etag-users/1")
-        assert response.status_code == 200
-        # ETag should be in response headers
-        assert "ETag" in response.headers
@@ -5,29 +5,23 @@ Verifies that PydanticSchema works correctly alongside marshmallow-dataclass
 which provides similar functionality for Python dataclasses.
 """
 from dataclasses import dataclass, field as dataclass_field
+from types import MappingProxyType
 
+import orjson
 import pytest
-from marshmallow import Schema
-from pydantic import BaseModel, Field
 
-from pydantic_marshmallow import schema_for
-
-# Third-party imports with conditional availability
-try:
-    import marshmallow_dataclass
-    from marshmallow_dataclass import dataclass as mm_dataclass
+marshmallow_dataclass = pytest.importorskip(
+    "marshmallow_dataclass", reason="marshmallow-dataclass not installed"
+)
 
-    MARSHMALLOW_DATACLASS_AVAILABLE = True
-except ImportError:
-    MARSHMALLOW_DATACLASS_AVAILABLE = False
+from marshmallow import Schema, ValidationError  # noqa: E402
+from pydantic import BaseModel, Field  # noqa: E402
 
-pytestmark = pytest.mark.skipif(
-    not MARSHMALLOW_DATACLASS_AVAILABLE, reason="marshmallow-dataclass not installed"
-)
+from pydantic_marshmallow import BridgeValidationError, schema_for  # noqa: E402
 
 
 # Standard dataclasses for testing with marshmallow-dataclass
-@dataclass
+@dataclass(slots=True)
 class AddressDataclass:
     """Address as a dataclass."""
 
@@ -37,7 +31,7 @@ class AddressDataclass:
     zip_code: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDataclass:
     """User as a dataclass."""
 
@@ -47,7 +41,7 @@ class UserDataclass:
     address: AddressDataclass | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductDataclass:
     """Product as a dataclass."""
 
@@ -85,13 +79,50 @@ class ProductPydantic(BaseModel):
     description: str | None = None
 
 
+# Schemas are built once per module and shared read-only across tests
+PydanticUserSchema = schema_for(UserPydantic)
+PydanticAddressSchema = schema_for(AddressPydantic)
+PydanticProductSchema = schema_for(ProductPydantic)
+DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
+DataclassAddressSchema = marshmallow_dataclass.class_schema(AddressDataclass)
+DataclassProductSchema = marshmallow_dataclass.class_schema(ProductDataclass)
+
+# Schema instances hold no per-call state for plain load/dump, so one of each
+# is shared by every test that does not exercise instantiation itself
+PYDANTIC_USER = PydanticUserSchema()
+PYDANTIC_ADDRESS = PydanticAddressSchema()
+PYDANTIC_PRODUCT = PydanticProductSchema()
+DATACLASS_USER = DataclassUserSchema()
+DATACLASS_ADDRESS = DataclassAddressSchema()
+DATACLASS_PRODUCT = DataclassProductSchema()
+
+
+# Payloads shared by several tests; read-only so no test can leak edits
+USER_PAYLOAD = MappingProxyType({"name": "Test User", "email": "test@example.com"})
+ADDRESS_PAYLOAD = MappingProxyType({"street": "123 Main St", "city": "Boston"})
+NESTED_USER_PAYLOAD = MappingProxyType(
+    {
+        **USER_PAYLOAD,
+        "age": 25,
+        "address": MappingProxyType({**ADDRESS_PAYLOAD, "country": "USA"}),
+    }
+)
+# The same user as a request body would arrive on the wire
+USER_JSON = orjson.dumps({**USER_PAYLOAD, "age": 25})
+
+
+def process_with_schema(schema: Schema, data: dict) -> dict:
+    """Generic function that works with any Marshmallow schema."""
+    instance = schema.load(data)
+    return schema.dump(instance)
+
+
 class TestMarshmallowDataclassBaseline:
     """Verify marshmallow-dataclass works normally (baseline)."""
 
     def test_dataclass_schema_generation(self):
         """marshmallow-dataclass can generate schemas from dataclasses."""
-        UserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-        schema = UserSchema()
+        schema = DataclassUserSchema()
 
         assert schema is not None
         assert hasattr(schema, "load")
@@ -99,10 +130,7 @@ class TestMarshmallowDataclassBaseline:
 
     def test_dataclass_schema_load(self):
         """marshmallow-dataclass schemas can load data."""
-        UserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-        schema = UserSchema()
-
-        user = schema.load({"name": "Test User", "email": "test@example.com"})
+        user = DATACLASS_USER.load(USER_PAYLOAD)
 
         assert isinstance(user, UserDataclass)
         assert user.name == "Test User"
@@ -110,11 +138,8 @@ class TestMarshmallowDataclassBaseline:
 
     def test_dataclass_schema_dump(self):
         """marshmallow-dataclass schemas can dump data."""
-        UserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-        schema = UserSchema()
-
         user = UserDataclass(name="Test User", email="test@example.com")
-        result = schema.dump(user)
+        result = DATACLASS_USER.dump(user)
 
         assert result["name"] == "Test User"
         assert result["email"] == "test@example.com"
@@ -125,46 +150,27 @@ class TestBothSchemasCoexist:
 
     def test_both_schemas_in_same_module(self):
         """Both schema types can coexist in the same module."""
-        # Pydantic schema
-        PydanticUserSchema = schema_for(UserPydantic)
-
-        # Dataclass schema
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
         # Both should be valid Schema subclasses
         assert issubclass(PydanticUserSchema, Schema)
         assert issubclass(DataclassUserSchema, Schema)
 
     def test_schemas_produce_different_instances(self):
         """Each schema type produces its own model instances."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
-        data = {"name": "Test User", "email": "test@example.com", "age": 25}
+        data = {**USER_PAYLOAD, "age": 25}
 
         # Load through Pydantic schema
-        pydantic_user = PydanticUserSchema().load(data)
+        pydantic_user = PYDANTIC_USER.load(data)
         assert isinstance(pydantic_user, UserPydantic)
 
         # Load through dataclass schema
-        dataclass_user = DataclassUserSchema().load(data)
+        dataclass_user = DATACLASS_USER.load(data)
         assert isinstance(dataclass_user, UserDataclass)
 
     def test_schemas_have_same_basic_behavior(self):
         """Both schemas handle basic cases similarly."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
-        data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "age": 25,
-            "address": {"street": "123 Main St", "city": "Boston", "country": "USA"},
-        }
-
         # Both should successfully load the data
-        pydantic_user = PydanticUserSchema().load(data)
-        dataclass_user = DataclassUserSchema().load(data)
+        pydantic_user = PYDANTIC_USER.load(NESTED_USER_PAYLOAD)
+        dataclass_user = DATACLASS_USER.load(NESTED_USER_PAYLOAD)
 
         # Both should have the same field values
         assert pydantic_user.name == dataclass_user.name
@@ -177,39 +183,30 @@ class TestFieldCompatibility:
 
     def test_optional_fields(self):
         """Both handle optional fields correctly."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
         data = {"name": "Test", "email": "test@example.com"}
 
-        pydantic_user = PydanticUserSchema().load(data)
-        dataclass_user = DataclassUserSchema().load(data)
+        pydantic_user = PYDANTIC_USER.load(data)
+        dataclass_user = DATACLASS_USER.load(data)
 
         assert pydantic_user.age is None
         assert dataclass_user.age is None
 
     def test_default_values(self):
         """Both respect default values."""
-        PydanticAddressSchema = schema_for(AddressPydantic)
-        DataclassAddressSchema = marshmallow_dataclass.class_schema(AddressDataclass)
-
         data = {"street": "123 Main", "city": "Boston"}
 
-        pydantic_address = PydanticAddressSchema().load(data)
-        dataclass_address = DataclassAddressSchema().load(data)
+        pydantic_address = PYDANTIC_ADDRESS.load(data)
+        dataclass_address = DATACLASS_ADDRESS.load(data)
 
         assert pydantic_address.country == "USA"
         assert dataclass_address.country == "USA"
 
     def test_list_fields(self):
         """Both handle list fields correctly."""
-        PydanticProductSchema = schema_for(ProductPydantic)
-        DataclassProductSchema = marshmallow_dataclass.class_schema(ProductDataclass)
-
         data = {"name": "Widget", "price": 19.99, "tags": ["sale", "featured"]}
 
-        pydantic_product = PydanticProductSchema().load(data)
-        dataclass_product = DataclassProductSchema().load(data)
+        pydantic_product = PYDANTIC_PRODUCT.load(data)
+        dataclass_product = DATACLASS_PRODUCT.load(data)
 
         assert pydantic_product.tags == ["sale", "featured"]
         assert dataclass_product.tags == ["sale", "featured"]
@@ -220,24 +217,14 @@ class TestNestedSchemas:
 
     def test_nested_pydantic_to_dataclass(self):
         """Nested data can flow between schema types."""
-        # Load with Pydantic, get nested data
-        PydanticUserSchema = schema_for(UserPydantic)
-
-        data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "address": {"street": "123 Main St", "city": "Boston"},
-        }
-
-        pydantic_user = PydanticUserSchema().load(data)
+        pydantic_user = PYDANTIC_USER.load(NESTED_USER_PAYLOAD)
         assert pydantic_user.address is not None
         assert pydantic_user.address.street == "123 Main St"
 
         # Dump and reload with dataclass schema
-        dumped = PydanticUserSchema().dump(pydantic_user)
+        dumped = PYDANTIC_USER.dump(pydantic_user)
 
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-        dataclass_user = DataclassUserSchema().load(dumped)
+        dataclass_user = DATACLASS_USER.load(dumped)
 
         assert dataclass_user.address is not None
         assert dataclass_user.address.street == "123 Main St"
@@ -248,29 +235,21 @@ class TestValidationDifferences:
 
     def test_pydantic_additional_validation(self):
         """Pydantic provides additional validation that dataclass doesn't."""
-        PydanticUserSchema = schema_for(UserPydantic)
-
-        from pydantic_marshmallow import BridgeValidationError
-
         # Pydantic schema has min_length constraint on name
         with pytest.raises(BridgeValidationError):
-            PydanticUserSchema().load({"name": "", "email": "test@example.com"})
+            PYDANTIC_USER.load({"name": "", "email": "test@example.com"})
 
         # Pydantic schema has ge=0 constraint on age
         with pytest.raises(BridgeValidationError):
-            PydanticUserSchema().load(
+            PYDANTIC_USER.load(
                 {"name": "Test", "email": "test@example.com", "age": -5}
             )
 
     def test_dataclass_basic_validation(self):
         """Dataclass schema provides basic type validation."""
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
-        from marshmallow import ValidationError
-
         # Invalid type for age should fail
         with pytest.raises(ValidationError):
-            DataclassUserSchema().load(
+            DATACLASS_USER.load(
                 {"name": "Test", "email": "test@example.com", "age": "not an int"}
             )
 
@@ -280,9 +259,6 @@ class TestSchemaInheritance:
 
     def test_both_are_schema_subclasses(self):
         """Both schema types are Marshmallow Schema subclasses."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
         assert issubclass(PydanticUserSchema, Schema)
         assert issubclass(DataclassUserSchema, Schema)
 
@@ -291,9 +267,6 @@ class TestSchemaInheritance:
 
     def test_both_have_standard_attributes(self):
         """Both schema types have standard Marshmallow attributes."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
         for SchemaClass in [PydanticUserSchema, DataclassUserSchema]:
             schema = SchemaClass()
 
@@ -309,54 +282,61 @@ class TestMixedUsage:
 
     def test_api_style_workflow(self):
         """Both schemas work in API-style workflows."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
-        # Simulate receiving JSON-like data
-        incoming_data = {
-            "name": "API User",
-            "email": "api@example.com",
-            "age": 30,
-            "address": {"street": "456 Oak Ave", "city": "Seattle"},
-        }
-
-        # Validate with either schema
-        pydantic_user = PydanticUserSchema().load(incoming_data)
-        dataclass_user = DataclassUserSchema().load(incoming_data)
+        # Validate the same incoming JSON-like data with either schema
+        pydantic_user = PYDANTIC_USER.load(NESTED_USER_PAYLOAD)
+        dataclass_user = DATACLASS_USER.load(NESTED_USER_PAYLOAD)
 
         # Serialize back (for response)
-        pydantic_output = PydanticUserSchema().dump(pydantic_user)
-        dataclass_output = DataclassUserSchema().dump(dataclass_user)
+        pydantic_output = PYDANTIC_USER.dump(pydantic_user)
+        dataclass_output = DATACLASS_USER.dump(dataclass_user)
 
         # Both should produce similar output
         assert pydantic_output["name"] == dataclass_output["name"]
         assert pydantic_output["email"] == dataclass_output["email"]
 
+    def test_api_style_workflow_over_json(self):
+        """Both schemas round-trip the same JSON request body via loads/dumps."""
+        pydantic_output = orjson.loads(PYDANTIC_USER.dumps(PYDANTIC_USER.loads(USER_JSON)))
+        dataclass_output = orjson.loads(DATACLASS_USER.dumps(DATACLASS_USER.loads(USER_JSON)))
+
+        for key in ("name", "email", "age"):
+            assert pydantic_output[key] == dataclass_output[key]
+
     def test_data_transfer_between_schemas(self):
         """Data can be transferred between Pydantic and dataclass instances."""
-        PydanticUserSchema = schema_for(UserPydantic)
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
         # Start with Pydantic instance
         pydantic_user = UserPydantic(
             name="Transfer User", email="transfer@example.com", age=25
         )
 
         # Dump to dict
-        data = PydanticUserSchema().dump(pydantic_user)
+        data = PYDANTIC_USER.dump(pydantic_user)
 
         # Load as dataclass
-        dataclass_user = DataclassUserSchema().load(data)
+        dataclass_user = DATACLASS_USER.load(data)
 
         assert dataclass_user.name == "Transfer User"
         assert dataclass_user.email == "transfer@example.com"
 
         # And back to Pydantic
-        data2 = DataclassUserSchema().dump(dataclass_user)
-        pydantic_user2 = PydanticUserSchema().load(data2)
+        data2 = DATACLASS_USER.dump(dataclass_user)
+        pydantic_user2 = PYDANTIC_USER.load(data2)
 
         assert pydantic_user2.name == "Transfer User"
 
+    def test_data_transfer_between_schemas_bytes(self):
+        """Data can be transferred between both schema types as JSON bytes."""
+        pydantic_user = PYDANTIC_USER.loads(USER_JSON)
+        dataclass_user = DATACLASS_USER.loads(USER_JSON)
+
+        assert dataclass_user.name == pydantic_user.name == "Test User"
+        assert dataclass_user.age == pydantic_user.age == 25
+
+        # Dataclass output reloads through the Pydantic schema
+        pydantic_user2 = PYDANTIC_USER.loads(DATACLASS_USER.dumps(dataclass_user))
+
+        assert pydantic_user2 == pydantic_user
+
 
 class TestUseCase:
     """Test practical use cases for having both schema types."""
@@ -368,17 +348,12 @@ class TestUseCase:
         A team might have existing dataclasses but want to use Pydantic
         for new models. Both should work together.
         """
-        # Existing legacy dataclass schema
-        LegacyUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
-
-        # New Pydantic model schema
-        NewProductSchema = schema_for(ProductPydantic)
-
-        # Both work in same codebase
-        user = LegacyUserSchema().load(
+        # Existing legacy dataclass schema and new Pydantic model schema
+        # both work in same codebase
+        user = DATACLASS_USER.load(
             {"name": "Legacy User", "email": "legacy@example.com"}
         )
-        product = NewProductSchema().load(
+        product = PYDANTIC_PRODUCT.load(
             {"name": "New Product", "price": 29.99, "tags": ["new"]}
         )
 
@@ -387,23 +362,15 @@ class TestUseCase:
 
     def test_interoperability_with_existing_code(self):
         """Test that Pydantic schemas work where dataclass schemas worked."""
-
-        def process_with_schema(schema: Schema, data: dict) -> dict:
-            """Generic function that works with any Marshmallow schema."""
-            instance = schema.load(data)
-            return schema.dump(instance)
-
         # Works with dataclass schema
-        DataclassUserSchema = marshmallow_dataclass.class_schema(UserDataclass)
         result1 = process_with_schema(
-            DataclassUserSchema(),
+            DATACLASS_USER,
             {"name": "DC User", "email": "dc@example.com"},
         )
 
         # Also works with Pydantic schema
-        PydanticUserSchema = schema_for(UserPydantic)
         result2 = process_with_schema(
-            PydanticUserSchema(),
+            PYDANTIC_USER,
             {"name": "Pydantic User", "email": "pydantic@example.com"},
         )
 
@@ -10,6 +10,7 @@ import pytest
 
 oneofschema = pytest.importorskip("marshmallow_oneofschema")
 
+from marshmallow import ValidationError  # noqa: E402
 from pydantic import BaseModel, Field  # noqa: E402
 
 from pydantic_marshmallow import PydanticSchema  # noqa: E402
@@ -85,130 +86,139 @@ class AnimalSchema(oneofschema.OneOfSchema):
         "cat": CatSchema,
         "bird": BirdSchema,
     }
+    # Exact-type dispatch: one dict lookup instead of an isinstance chain
+    _TYPE_MAP = {Dog: "dog", Cat: "cat", Bird: "bird"}
 
     def get_obj_type(self, obj):
         """Get type string from object."""
-        if isinstance(obj, Dog):
-            return "dog"
-        elif isinstance(obj, Cat):
-            return "cat"
-        elif isinstance(obj, Bird):
-            return "bird"
-        else:
-            raise ValueError(f"Unknown animal type: {type(obj)}")
+        try:
+            return self._TYPE_MAP[type(obj)]
+        except KeyError:
+            raise ValueError(f"Unknown animal type: {type(obj)}") from None
 
 
-# =============================================================================
-# Tests
-# =============================================================================
-
-
-class TestOneOfSchemaBasics:
-    """Test basic OneOfSchema functionality with PydanticSchema."""
-
-    def test_load_dog(self):
-        """Test loading a dog through polymorphic schema."""
-        schema = AnimalSchema()
-        data = {
-            "type": "dog",
-            "name": "Buddy",
-            "age": 5,
-            "breed": "Golden Retriever",
-            "is_good_boy": True,
-        }
+class CustomAnimalSchema(oneofschema.OneOfSchema):
+    """Polymorphic Dog/Cat schema using a custom type field name."""
 
-        result = schema.load(data)
+    type_field = "animal_type"  # Custom field name
+    type_schemas = {
+        "dog": DogSchema,
+        "cat": CatSchema,
+    }
+    _TYPE_MAP = {Dog: "dog", Cat: "cat"}
 
-        assert isinstance(result, Dog)
-        assert result.name == "Buddy"
-        assert result.age == 5
-        assert result.breed == "Golden Retriever"
-        assert result.is_good_boy is True
+    def get_obj_type(self, obj):
+        """Get type string from object."""
+        try:
+            return self._TYPE_MAP[type(obj)]
+        except KeyError:
+            raise ValueError(f"Unknown type: {type(obj)}") from None
 
-    def test_load_cat(self):
-        """Test loading a cat through polymorphic schema."""
-        schema = AnimalSchema()
-        data = {
-            "type": "cat",
-            "name": "Whiskers",
-            "age": 3,
-            "indoor": True,
-            "lives_remaining": 9,
-        }
 
-        result = schema.load(data)
+# Expected per-item results for the mixed many=True payloads below
+MIXED_LOAD_EXPECTED = ((Dog, "Rex"), (Cat, "Luna"), (Bird, "Sky"))
+MIXED_DUMP_TYPES = ["dog", "cat", "bird"]
 
-        assert isinstance(result, Cat)
-        assert result.name == "Whiskers"
-        assert result.age == 3
-        assert result.indoor is True
-        assert result.lives_remaining == 9
 
-    def test_load_bird(self):
-        """Test loading a bird through polymorphic schema."""
-        schema = AnimalSchema()
-        data = {
-            "type": "bird",
-            "name": "Tweety",
-            "age": 2,
-            "wingspan_cm": 15.5,
-            "can_fly": True,
-        }
+# =============================================================================
+# Fixtures
+# =============================================================================
 
-        result = schema.load(data)
 
-        assert isinstance(result, Bird)
-        assert result.name == "Tweety"
-        assert result.age == 2
-        assert result.wingspan_cm == 15.5
-        assert result.can_fly is True
+@pytest.fixture(scope="module")
+def animal_schema():
+    """One AnimalSchema shared read-only by every single-object test."""
+    return AnimalSchema()
 
-    def test_dump_dog(self):
-        """Test dumping a dog through polymorphic schema."""
-        schema = AnimalSchema()
-        dog = Dog(name="Max", age=4, breed="Labrador", is_good_boy=True)
 
-        result = schema.dump(dog)
+@pytest.fixture(scope="module")
+def animal_schema_many():
+    """One AnimalSchema(many=True) shared by the list tests."""
+    return AnimalSchema(many=True)
 
-        assert result["type"] == "dog"
-        assert result["name"] == "Max"
-        assert result["age"] == 4
-        assert result["breed"] == "Labrador"
-        assert result["is_good_boy"] is True
 
-    def test_dump_cat(self):
-        """Test dumping a cat through polymorphic schema."""
-        schema = AnimalSchema()
-        cat = Cat(name="Felix", age=7, indoor=False, lives_remaining=8)
+@pytest.fixture(scope="module")
+def custom_animal_schema():
+    """One CustomAnimalSchema shared by the type-field tests."""
+    return CustomAnimalSchema()
 
-        result = schema.dump(cat)
 
-        assert result["type"] == "cat"
-        assert result["name"] == "Felix"
-        assert result["age"] == 7
-        assert result["indoor"] is False
-        assert result["lives_remaining"] == 8
+# =============================================================================
+# Tests
+# =============================================================================
 
-    def test_dump_bird(self):
-        """Test dumping a bird through polymorphic schema."""
-        schema = AnimalSchema()
-        bird = Bird(name="Polly", age=10, wingspan_cm=25.0, can_fly=False)
 
-        result = schema.dump(bird)
+class TestOneOfSchemaBasics:
+    """Test basic OneOfSchema functionality with PydanticSchema."""
 
-        assert result["type"] == "bird"
-        assert result["name"] == "Polly"
-        assert result["age"] == 10
-        assert result["wingspan_cm"] == 25.0
-        assert result["can_fly"] is False
+    @pytest.mark.parametrize(
+        "data,model_cls",
+        [
+            (
+                {
+                    "type": "dog",
+                    "name": "Buddy",
+                    "age": 5,
+                    "breed": "Golden Retriever",
+                    "is_good_boy": True,
+                },
+                Dog,
+            ),
+            (
+                {
+                    "type": "cat",
+                    "name": "Whiskers",
+                    "age": 3,
+                    "indoor": True,
+                    "lives_remaining": 9,
+                },
+                Cat,
+            ),
+            (
+                {
+                    "type": "bird",
+                    "name": "Tweety",
+                    "age": 2,
+                    "wingspan_cm": 15.5,
+                    "can_fly": True,
+                },
+                Bird,
+            ),
+        ],
+        ids=["dog", "cat", "bird"],
+    )
+    def test_load_polymorphic(self, animal_schema, data, model_cls):
+        """Test loading each animal type through polymorphic schema."""
+        result = animal_schema.load(data)
+
+        assert isinstance(result, model_cls)
+        for key, value in data.items():
+            if key != "type":
+                assert getattr(result, key) == value
+
+    @pytest.mark.parametrize(
+        "animal,type_name",
+        [
+            (Dog(name="Max", age=4, breed="Labrador", is_good_boy=True), "dog"),
+            (Cat(name="Felix", age=7, indoor=False, lives_remaining=8), "cat"),
+            (Bird(name="Polly", age=10, wingspan_cm=25.0, can_fly=False), "bird"),
+        ],
+        ids=["dog", "cat", "bird"],
+    )
+    def test_dump_polymorphic(self, animal_schema, animal, type_name):
+        """Test dumping each animal type through polymorphic schema."""
+        result = animal_schema.dump(animal)
+
+        assert result["type"] == type_name
+        for key, value in animal.model_dump().items():
+            assert result[key] == value
 
 
 class TestOneOfSchemaValidation:
     """Test that Pydantic validation works through OneOfSchema."""
 
-    def test_validation_error_propagates(self):
+    def test_validation_error_propagates(self, animal_schema):
         """Test that Pydantic validation errors propagate correctly."""
-        schema = AnimalSchema()
         data = {
             "type": "dog",
             "name": "Buddy",
@@ -216,12 +226,11 @@ class TestOneOfSchemaValidation:
             "breed": "Lab",
         }
 
-        with pytest.raises(Exception):  # noqa: B017
-            schema.load(data)
+        with pytest.raises(ValidationError):
+            animal_schema.load(data)
 
-    def test_cat_lives_validation(self):
+    def test_cat_lives_validation(self, animal_schema):
         """Test Cat's lives_remaining constraint (0-9)."""
-        schema = AnimalSchema()
         data = {
             "type": "cat",
             "name": "Mittens",
@@ -229,12 +238,11 @@ class TestOneOfSchemaValidation:
             "lives_remaining": 10,  # Invalid: max is 9
         }
 
-        with pytest.raises(Exception):  # noqa: B017
-            schema.load(data)
+        with pytest.raises(ValidationError):
+            animal_schema.load(data)
 
-    def test_bird_wingspan_validation(self):
+    def test_bird_wingspan_validation(self, animal_schema):
         """Test Bird's wingspan constraint (>= 0)."""
-        schema = AnimalSchema()
         data = {
             "type": "bird",
             "name": "Tweety",
@@ -242,68 +250,57 @@ class TestOneOfSchemaValidation:
             "wingspan_cm": -5.0,  # Invalid: must be >= 0
         }
 
-        with pytest.raises(Exception):  # noqa: B017
-            schema.load(data)
+        with pytest.raises(ValidationError):
+            animal_schema.load(data)
 
-    def test_unknown_type_error(self):
+    def test_unknown_type_error(self, animal_schema):
         """Test that unknown type raises error."""
-        schema = AnimalSchema()
         data = {
             "type": "fish",
             "name": "Nemo",
             "age": 1,
         }
 
-        with pytest.raises(Exception):  # noqa: B017
-            schema.load(data)
+        with pytest.raises(ValidationError):
+            animal_schema.load(data)
 
 
 class TestOneOfSchemaWithMany:
     """Test OneOfSchema with many=True (list of polymorphic objects)."""
 
-    def test_load_many_mixed(self):
+    def test_load_many_mixed(self, animal_schema_many):
         """Test loading a list of mixed animal types."""
-        schema = AnimalSchema(many=True)
         data = [
             {"type": "dog", "name": "Rex", "age": 3, "breed": "German Shepherd"},
             {"type": "cat", "name": "Luna", "age": 2, "indoor": True},
             {"type": "bird", "name": "Sky", "age": 1, "wingspan_cm": 20.0},
         ]
 
-        result = schema.load(data)
+        result = animal_schema_many.load(data)
 
-        assert len(result) == 3
-        assert isinstance(result[0], Dog)
-        assert isinstance(result[1], Cat)
-        assert isinstance(result[2], Bird)
+        assert len(result) == len(MIXED_LOAD_EXPECTED)
+        for item, (model_cls, name) in zip(result, MIXED_LOAD_EXPECTED, strict=True):
+            assert isinstance(item, model_cls)
+            assert item.name == name
 
-        assert result[0].name == "Rex"
-        assert result[1].name == "Luna"
-        assert result[2].name == "Sky"
-
-    def test_dump_many_mixed(self):
+    def test_dump_many_mixed(self, animal_schema_many):
         """Test dumping a list of mixed animal types."""
-        schema = AnimalSchema(many=True)
         animals = [
             Dog(name="Spot", age=4, breed="Dalmatian"),
             Cat(name="Garfield", age=8, indoor=True),
             Bird(name="Zazu", age=5, wingspan_cm=30.0),
         ]
 
-        result = schema.dump(animals)
+        result = animal_schema_many.dump(animals)
 
-        assert len(result) == 3
-        assert result[0]["type"] == "dog"
-        assert result[1]["type"] == "cat"
-        assert result[2]["type"] == "bird"
+        assert [item["type"] for item in result] == MIXED_DUMP_TYPES
 
 
 class TestOneOfSchemaDefaults:
     """Test that Pydantic defaults work correctly through OneOfSchema."""
 
-    def test_dog_default_good_boy(self):
+    def test_dog_default_good_boy(self, animal_schema):
         """Test Dog's is_good_boy defaults to True."""
-        schema = AnimalSchema()
         data = {
             "type": "dog",
             "name": "Cooper",
@@ -312,13 +309,12 @@ class TestOneOfSchemaDefaults:
             # is_good_boy not provided - should default to True
         }
 
-        result = schema.load(data)
+        result = animal_schema.load(data)
 
         assert result.is_good_boy is True
 
-    def test_cat_default_lives(self):
+    def test_cat_default_lives(self, animal_schema):
         """Test Cat's lives_remaining defaults to 9."""
-        schema = AnimalSchema()
         data = {
             "type": "cat",
             "name": "Shadow",
@@ -326,14 +322,13 @@ class TestOneOfSchemaDefaults:
             # indoor and lives_remaining not provided
         }
 
-        result = schema.load(data)
+        result = animal_schema.load(data)
 
         assert result.indoor is True
         assert result.lives_remaining == 9
 
-    def test_bird_default_can_fly(self):
+    def test_bird_default_can_fly(self, animal_schema):
         """Test Bird's can_fly defaults to True."""
-        schema = AnimalSchema()
         data = {
             "type": "bird",
             "name": "Robin",
@@ -342,7 +337,7 @@ class TestOneOfSchemaDefaults:
             # can_fly not provided
         }
 
-        result = schema.load(data)
+        result = animal_schema.load(data)
 
         assert result.can_fly is True
 
@@ -350,25 +345,8 @@ class TestOneOfSchemaDefaults:
 class TestOneOfSchemaWithTypeField:
     """Test type field customization."""
 
-    def test_custom_type_field_name(self):
+    def test_custom_type_field_name(self, custom_animal_schema):
         """Test using a custom type field name."""
-
-        class CustomAnimalSchema(oneofschema.OneOfSchema):
-            type_field = "animal_type"  # Custom field name
-            type_schemas = {
-                "dog": DogSchema,
-                "cat": CatSchema,
-            }
-
-            def get_obj_type(self, obj):
-                if isinstance(obj, Dog):
-                    return "dog"
-                elif isinstance(obj, Cat):
-                    return "cat"
-                raise ValueError(f"Unknown type: {type(obj)}")
-
-        schema = CustomAnimalSchema()
-
         # Load with custom type field
         data = {
             "animal_type": "dog",
@@ -377,11 +355,11 @@ class TestOneOfSchemaWithTypeField:
             "breed": "Boxer",
         }
 
-        result = schema.load(data)
+        result = custom_animal_schema.load(data)
         assert isinstance(result, Dog)
         assert result.name == "Duke"
 
         # Dump includes custom type field
-        dumped = schema.dump(result)
+        dumped = custom_animal_schema.dump(result)
         assert "animal_type" in dumped
         assert dumped["animal_type"] == "dog"
@@ -6,51 +6,42 @@ and in typical SQLAlchemy application patterns.
 """
 
 import pytest
+
+# marshmallow-sqlalchemy is probed first so nothing heavy is imported when
+# the module is skipped; it pulls in sqlalchemy itself when present.
+pytest.importorskip(
+    "marshmallow_sqlalchemy", reason="sqlalchemy and marshmallow-sqlalchemy not installed"
+)
+
 from marshmallow import Schema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, SQLAlchemySchema
 from pydantic import BaseModel, Field
+from sqlalchemy import ForeignKey, String, create_engine, event
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
 
 from pydantic_marshmallow import PydanticSchema, schema_for
 
-# Third-party imports with conditional availability
-try:
-    from sqlalchemy import Column, Float, ForeignKey, Integer, String, create_engine
-    from sqlalchemy.orm import Session, declarative_base, relationship
-
-    SQLALCHEMY_AVAILABLE = True
-except ImportError:
-    SQLALCHEMY_AVAILABLE = False
-
-try:
-    from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, SQLAlchemySchema
-
-    MARSHMALLOW_SQLALCHEMY_AVAILABLE = SQLALCHEMY_AVAILABLE
-except ImportError:
-    MARSHMALLOW_SQLALCHEMY_AVAILABLE = False
 
-pytestmark = pytest.mark.skipif(
-    not MARSHMALLOW_SQLALCHEMY_AVAILABLE,
-    reason="sqlalchemy and marshmallow-sqlalchemy not installed",
-)
+# SQLAlchemy models
+class Base(DeclarativeBase):
+    pass
 
 
-# SQLAlchemy models
-if SQLALCHEMY_AVAILABLE:
-    Base = declarative_base()
+class AuthorModel(Base):
+    __tablename__ = "authors"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    email: Mapped[str | None] = mapped_column(String(200))
+    books: Mapped[list["BookModel"]] = relationship(back_populates="author")
 
-    class AuthorModel(Base):
-        __tablename__ = "authors"
-        id = Column(Integer, primary_key=True)
-        name = Column(String(100), nullable=False)
-        email = Column(String(200))
-        books = relationship("BookModel", back_populates="author")
 
-    class BookModel(Base):
-        __tablename__ = "books"
-        id = Column(Integer, primary_key=True)
-        title = Column(String(200), nullable=False)
-        price = Column(Float, default=0.0)
-        author_id = Column(Integer, ForeignKey("authors.id"))
-        author = relationship("AuthorModel", back_populates="books")
+class BookModel(Base):
+    __tablename__ = "books"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(200))
+    price: Mapped[float | None] = mapped_column(default=0.0)
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"))
+    author: Mapped["AuthorModel | None"] = relationship(back_populates="books")
 
 
 # Pydantic models (for comparison/parallel use)
@@ -67,19 +58,48 @@ class BookPydantic(BaseModel):
     author_id: int | None = None
 
 
-@pytest.fixture
+class BookWithAuthor(BaseModel):
+    title: str
+    author: AuthorPydantic
+
+
+# Schemas are built once per module and shared read-only across tests
+AuthorAPISchema = schema_for(AuthorPydantic)
+BookWithAuthorSchema = schema_for(BookWithAuthor)
+
+
+@pytest.fixture(scope="module")
 def engine():
-    """Create an in-memory SQLite database."""
+    """Create an in-memory SQLite database and its tables once per module."""
     engine = create_engine("sqlite:///:memory:")
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; hand BEGIN
+    # back to SQLAlchemy so the per-test rollback below actually undoes writes
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def session(engine):
-    """Create a database session."""
-    with Session(engine) as session:
-        yield session
+    """Create a database session whose writes are rolled back after the test.
+
+    ``session.commit()`` only releases a SAVEPOINT inside the outer
+    transaction, so every test starts from the same empty tables.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+        transaction.rollback()
 
 
 class TestSQLAlchemyAutoSchemaBaseline:
@@ -96,7 +116,7 @@ class TestSQLAlchemyAutoSchemaBaseline:
 
         author = AuthorModel(name="Test Author", email="test@example.com")
         session.add(author)
-        session.commit()
+        session.flush()
 
         schema = AuthorSchema()
         result = schema.dump(author)
@@ -135,9 +155,6 @@ class TestPydanticSchemaAlongsideSQLAlchemy:
                 load_instance = True
                 sqla_session = session
 
-        # Pydantic schema for API validation
-        AuthorAPISchema = schema_for(AuthorPydantic)
-
         # Both work independently
         sql_schema = AuthorSQLSchema()
         api_schema = AuthorAPISchema()
@@ -155,10 +172,9 @@ class TestPydanticSchemaAlongsideSQLAlchemy:
         # Create ORM object
         author = AuthorModel(name="ORM Author", email="orm@example.com")
         session.add(author)
-        session.commit()
+        session.flush()
 
         # Use Pydantic schema to validate/transform
-        AuthorAPISchema = schema_for(AuthorPydantic)
         schema = AuthorAPISchema()
 
         # Dump ORM data to dict, then load through Pydantic
@@ -178,23 +194,20 @@ class TestTypeHierarchyCompatibility:
 
     def test_instance_check(self):
         """PydanticSchema instances pass isinstance checks."""
-        AuthorSchema = schema_for(AuthorPydantic)
-        schema = AuthorSchema()
+        schema = AuthorAPISchema()
         assert isinstance(schema, Schema)
 
     def test_schema_class_attributes(self):
         """PydanticSchema has expected Schema class attributes."""
-        AuthorSchema = schema_for(AuthorPydantic)
-
         # Has Meta
-        assert hasattr(AuthorSchema, "Meta")
+        assert hasattr(AuthorAPISchema, "Meta")
         # Has fields
-        assert hasattr(AuthorSchema, "_declared_fields")
+        assert hasattr(AuthorAPISchema, "_declared_fields")
         # Has load/dump methods
-        assert hasattr(AuthorSchema, "load")
-        assert hasattr(AuthorSchema, "dump")
-        assert hasattr(AuthorSchema, "loads")
-        assert hasattr(AuthorSchema, "dumps")
+        assert hasattr(AuthorAPISchema, "load")
+        assert hasattr(AuthorAPISchema, "dump")
+        assert hasattr(AuthorAPISchema, "loads")
+        assert hasattr(AuthorAPISchema, "dumps")
 
 
 class TestMixedWorkflows:
@@ -203,7 +216,6 @@ class TestMixedWorkflows:
     def test_api_input_to_orm(self, session):
         """Validate API input with Pydantic, then create ORM object."""
         # Validate incoming API data
-        AuthorAPISchema = schema_for(AuthorPydantic)
         api_schema = AuthorAPISchema()
 
         validated = api_schema.load(
@@ -213,7 +225,7 @@ class TestMixedWorkflows:
         # Create ORM object from validated data
         orm_author = AuthorModel(name=validated.name, email=validated.email)
         session.add(orm_author)
-        session.commit()
+        session.flush()
 
         assert orm_author.id is not None
         assert orm_author.name == "API Input Author"
@@ -223,10 +235,9 @@ class TestMixedWorkflows:
         # Create ORM object
         author = AuthorModel(name="DB Author", email="db@example.com")
         session.add(author)
-        session.commit()
+        session.flush()
 
         # Serialize through Pydantic schema for API response
-        AuthorAPISchema = schema_for(AuthorPydantic)
         schema = AuthorAPISchema()
 
         # Create Pydantic model from ORM data
@@ -242,7 +253,6 @@ class TestMixedWorkflows:
 
     def test_validation_before_orm_save(self, session):
         """Use Pydantic validation before saving to database."""
-        AuthorAPISchema = schema_for(AuthorPydantic)
         schema = AuthorAPISchema()
 
         # Invalid data should be rejected
@@ -261,12 +271,6 @@ class TestNestedSchemas:
 
     def test_pydantic_nested_models(self, session):
         """Pydantic schema with nested models works."""
-
-        class BookWithAuthor(BaseModel):
-            title: str
-            author: AuthorPydantic
-
-        BookWithAuthorSchema = schema_for(BookWithAuthor)
         schema = BookWithAuthorSchema()
 
         result = schema.load(
@@ -5,25 +5,26 @@ Verifies that PydanticSchema works correctly with webargs
 for request parsing and validation.
 """
 
+import re
+
 import pytest
+
+# Probe webargs first so flask is never imported when the module is skipped
+pytest.importorskip("webargs", reason="flask and webargs not installed")
+pytest.importorskip("flask", reason="flask and webargs not installed")
+
+from flask import Flask, Response, jsonify
 from marshmallow import Schema
 from pydantic import BaseModel, Field, field_validator
+from webargs import fields as webargs_fields
+from webargs.flaskparser import parser, use_args, use_kwargs
 
 from pydantic_marshmallow import schema_for
 
-# Third-party imports with conditional availability
-try:
-    from flask import Flask, jsonify
-    from webargs import fields as webargs_fields
-    from webargs.flaskparser import parser, use_args, use_kwargs
-
-    WEBARGS_AVAILABLE = True
-except ImportError:
-    WEBARGS_AVAILABLE = False
+from .conftest import EMAIL_PATTERN, OrjsonProvider, json_of
 
-pytestmark = pytest.mark.skipif(
-    not WEBARGS_AVAILABLE, reason="flask and webargs not installed"
-)
+# Scanned in C by the regex engine instead of a per-character generator
+_DIGIT_RE = re.compile(r"\d")
 
 
 # Pydantic models for testing
@@ -40,14 +41,14 @@ class UserCreate(BaseModel):
     """User creation schema."""
 
     name: str = Field(min_length=1, max_length=100)
-    email: str = Field(pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$")
+    email: str = Field(pattern=EMAIL_PATTERN)
     password: str = Field(min_length=8)
     age: int | None = Field(default=None, ge=13, le=150)
 
     @field_validator("password")
     @classmethod
     def password_must_have_digit(cls, v: str) -> str:
-        if not any(c.isdigit() for c in v):
+        if _DIGIT_RE.search(v) is None:
             raise ValueError("Password must contain at least one digit")
         return v
 
@@ -56,7 +57,7 @@ class UserUpdate(BaseModel):
     """User update schema (all fields optional)."""
 
     name: str | None = Field(default=None, min_length=1, max_length=100)
-    email: str | None = Field(default=None, pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$")
+    email: str | None = Field(default=None, pattern=EMAIL_PATTERN)
     age: int | None = Field(default=None, ge=13, le=150)
 
 
@@ -79,6 +80,44 @@ class ItemCreate(BaseModel):
     metadata: dict | None = None
 
 
+# Schemas are built once per module and shared read-only across tests
+SearchSchema = schema_for(SearchQuery)
+UserCreateSchema = schema_for(UserCreate)
+UserUpdateSchema = schema_for(UserUpdate)
+FilterSchema = schema_for(FilterParams)
+ItemSchema = schema_for(ItemCreate)
+
+
+@pytest.fixture(scope="module")
+def search_schema():
+    """One SearchSchema instance shared by every route in this module."""
+    return SearchSchema()
+
+
+@pytest.fixture(scope="module")
+def filter_schema():
+    """One FilterSchema instance shared by every route in this module."""
+    return FilterSchema()
+
+
+@pytest.fixture(scope="module")
+def item_schema():
+    """One ItemSchema instance shared by every route in this module."""
+    return ItemSchema()
+
+
+@pytest.fixture(scope="module")
+def webargs_user_create_schema():
+    """Schema for this module's UserCreate model (with a password rule)."""
+    return UserCreateSchema()
+
+
+@pytest.fixture(scope="module")
+def user_update_schema():
+    """One UserUpdateSchema instance shared by every route in this module."""
+    return UserUpdateSchema()
+
+
 # Flask fixtures (app, client) provided by conftest.py
 
 
@@ -107,7 +146,7 @@ class TestWebargsBaseline:
 
         response = client.get("/native-search?query=test&limit=5")
         assert response.status_code == 200
-        data = response.get_json()
+        data = json_of(response)
         assert data["query"] == "test"
         assert data["limit"] == 5
 
@@ -115,59 +154,50 @@ class TestWebargsBaseline:
 class TestPydanticSchemaWithWebargs:
     """Test PydanticSchema works with webargs decorators."""
 
-    def test_use_args_with_query_params(self, app, client):
+    def test_use_args_with_query_params(self, app, client, search_schema):
         """PydanticSchema works with @use_args for query params."""
-        SearchSchema = schema_for(SearchQuery)
-        search_schema = SearchSchema()
+        captured = []
 
         @app.route("/search")
         @use_args(search_schema, location="query")
         def search(args):
             # args is the Pydantic model instance
-            return jsonify(
-                {"query": args.query, "limit": args.limit, "offset": args.offset}
-            )
+            captured.append(args)
+            return "", 204
 
         response = client.get("/search?query=python&limit=25&offset=10")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["query"] == "python"
-        assert data["limit"] == 25
-        assert data["offset"] == 10
+        assert response.status_code == 204
+        (args,) = captured
+        assert args.query == "python"
+        assert args.limit == 25
+        assert args.offset == 10
 
-    def test_use_args_with_defaults(self, app, client):
+    def test_use_args_with_defaults(self, app, client, search_schema):
         """PydanticSchema uses default values correctly."""
-        SearchSchema = schema_for(SearchQuery)
-        search_schema = SearchSchema()
+        captured = []
 
         @app.route("/search-defaults")
         @use_args(search_schema, location="query")
         def search_defaults(args):
-            return jsonify(
-                {"query": args.query, "limit": args.limit, "offset": args.offset}
-            )
+            captured.append(args)
+            return "", 204
 
         response = client.get("/search-defaults?query=test")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["query"] == "test"
-        assert data["limit"] == 10  # default
-        assert data["offset"] == 0  # default
+        assert response.status_code == 204
+        (args,) = captured
+        assert args.query == "test"
+        assert args.limit == 10  # default
+        assert args.offset == 0  # default
 
-    def test_use_args_with_json_body(self, app, client):
+    def test_use_args_with_json_body(self, app, client, item_schema):
         """PydanticSchema works with @use_args for JSON body."""
-        ItemSchema = schema_for(ItemCreate)
-        item_schema = ItemSchema()
+        captured = []
 
         @app.route("/items", methods=["POST"])
         @use_args(item_schema, location="json")
         def create_item(args):
-            return (
-                jsonify(
-                    {"name": args.name, "price": args.price, "quantity": args.quantity}
-                ),
-                201,
-            )
+            captured.append(args)
+            return "", 201
 
         response = client.post(
             "/items",
@@ -175,52 +205,46 @@ class TestPydanticSchemaWithWebargs:
             content_type="application/json",
         )
         assert response.status_code == 201
-        data = response.get_json()
-        assert data["name"] == "Widget"
-        assert data["price"] == 19.99
-        assert data["quantity"] == 5
+        (args,) = captured
+        assert args.name == "Widget"
+        assert args.price == 19.99
+        assert args.quantity == 5
 
 
 class TestValidationWithWebargs:
     """Test Pydantic validation works through webargs."""
 
-    def test_validation_error_on_invalid_params(self, app, client):
+    def test_validation_error_on_invalid_params(self, app, client, search_schema):
         """Pydantic validation errors are raised through webargs."""
-        SearchSchema = schema_for(SearchQuery)
-        search_schema = SearchSchema()
 
         @app.route("/search-validated")
         @use_args(search_schema, location="query")
         def search_validated(args):
-            return jsonify({"query": args.query})
+            return "", 204
 
         # Missing required field
         response = client.get("/search-validated")
         assert response.status_code == 422  # webargs validation error
 
-    def test_constraint_validation(self, app, client):
+    def test_constraint_validation(self, app, client, search_schema):
         """Pydantic constraints are enforced through webargs."""
-        SearchSchema = schema_for(SearchQuery)
-        search_schema = SearchSchema()
 
         @app.route("/search-constrained")
         @use_args(search_schema, location="query")
         def search_constrained(args):
-            return jsonify({"limit": args.limit})
+            return "", 204
 
         # limit > 100 should fail
         response = client.get("/search-constrained?query=test&limit=500")
         assert response.status_code == 422
 
-    def test_custom_validator_with_webargs(self, app, client):
+    def test_custom_validator_with_webargs(self, app, client, webargs_user_create_schema):
         """Custom Pydantic validators work through webargs."""
-        UserSchema = schema_for(UserCreate)
-        user_schema = UserSchema()
 
         @app.route("/users", methods=["POST"])
-        @use_args(user_schema, location="json")
+        @use_args(webargs_user_create_schema, location="json")
         def create_user(args):
-            return jsonify({"name": args.name}), 201
+            return "", 201
 
         # Valid password (has digit)
         response = client.post(
@@ -250,10 +274,16 @@ class TestValidationWithWebargs:
 class TestFilterAndPagination:
     """Test filter/pagination patterns common in REST APIs."""
 
-    def test_filter_params_from_query(self, app, client):
-        """Filter params are parsed from query string."""
-        FilterSchema = schema_for(FilterParams)
-        filter_schema = FilterSchema()
+    @pytest.fixture(scope="class")
+    def filter_client(self, filter_schema):
+        """One app, one /items route and one test client for the whole class.
+
+        Routes are registered before the first request, so the client can be
+        shared across tests instead of rebuilt per function.
+        """
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+        app.config["TESTING"] = True
 
         @app.route("/items")
         @use_args(filter_schema, location="query")
@@ -268,99 +298,67 @@ class TestFilterAndPagination:
                 }
             )
 
-        response = client.get(
-            "/items?status=active&sort_by=name&order=asc&page=2&per_page=50"
-        )
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "active"
-        assert data["sort_by"] == "name"
-        assert data["order"] == "asc"
-        assert data["page"] == 2
-        assert data["per_page"] == 50
-
-    def test_filter_params_with_defaults(self, app, client):
-        """Filter params use defaults when not provided."""
-        FilterSchema = schema_for(FilterParams)
-        filter_schema = FilterSchema()
-
-        @app.route("/items-defaults")
-        @use_args(filter_schema, location="query")
-        def list_items_defaults(args):
-            return jsonify(
-                {
-                    "status": args.status,
-                    "sort_by": args.sort_by,
-                    "order": args.order,
-                    "page": args.page,
-                    "per_page": args.per_page,
-                }
-            )
-
-        response = client.get("/items-defaults")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] is None
-        assert data["sort_by"] == "created_at"
-        assert data["order"] == "desc"
-        assert data["page"] == 1
-        assert data["per_page"] == 20
-
-    def test_invalid_filter_value(self, app, client):
-        """Invalid filter values are rejected."""
-        FilterSchema = schema_for(FilterParams)
-        filter_schema = FilterSchema()
-
-        @app.route("/items-validated")
-        @use_args(filter_schema, location="query")
-        def list_items_validated(args):
-            return jsonify({"status": args.status})
-
-        # Invalid status value
-        response = client.get("/items-validated?status=invalid")
-        assert response.status_code == 422
+        return app.test_client()
+
+    @pytest.mark.parametrize(
+        "url,expected_status,expected",
+        [
+            (
+                "/items?status=active&sort_by=name&order=asc&page=2&per_page=50",
+                200,
+                {"status": "active", "sort_by": "name", "order": "asc", "page": 2, "per_page": 50},
+            ),
+            (
+                "/items",
+                200,
+                {"status": None, "sort_by": "created_at", "order": "desc", "page": 1, "per_page": 20},
+            ),
+            ("/items?status=invalid", 422, None),
+        ],
+        ids=["from_query", "with_defaults", "invalid_value"],
+    )
+    def test_filter_params(self, filter_client, url, expected_status, expected):
+        """Filter params are parsed from the query string, defaulted, or rejected."""
+        response = filter_client.get(url)
+        assert response.status_code == expected_status
+        if expected is not None:
+            assert json_of(response) == expected
 
 
 class TestPartialUpdates:
     """Test partial update patterns with optional fields."""
 
-    def test_partial_update_with_some_fields(self, app, client):
+    def test_partial_update_with_some_fields(self, app, client, user_update_schema):
         """Partial updates work with only some fields provided."""
-        UserUpdateSchema = schema_for(UserUpdate)
-        update_schema = UserUpdateSchema()
+        user_ids = []
 
         @app.route("/users/<int:user_id>", methods=["PATCH"])
-        @use_args(update_schema, location="json")
+        @use_args(user_update_schema, location="json")
         def update_user(args, user_id):
-            # Only return non-None fields
-            updates = {k: v for k, v in args.model_dump().items() if v is not None}
-            return jsonify({"user_id": user_id, "updates": updates})
+            user_ids.append(user_id)
+            # Only return non-None fields, serialized by pydantic-core
+            return Response(args.model_dump_json(exclude_none=True), mimetype="application/json")
 
         response = client.patch(
             "/users/1", json={"name": "New Name"}, content_type="application/json"
         )
         assert response.status_code == 200
-        data = response.get_json()
-        assert data["user_id"] == 1
-        assert data["updates"] == {"name": "New Name"}
+        assert user_ids == [1]
+        assert json_of(response) == {"name": "New Name"}
 
-    def test_partial_update_with_empty_body(self, app, client):
+    def test_partial_update_with_empty_body(self, app, client, user_update_schema):
         """Partial updates work with empty body (no changes)."""
-        UserUpdateSchema = schema_for(UserUpdate)
-        update_schema = UserUpdateSchema()
 
         @app.route("/users-empty/<int:user_id>", methods=["PATCH"])
-        @use_args(update_schema, location="json")
+        @use_args(user_update_schema, location="json")
         def update_user_empty(args, user_id):
-            updates = {k: v for k, v in args.model_dump().items() if v is not None}
-            return jsonify({"user_id": user_id, "updates": updates})
+            return Response(args.model_dump_json(exclude_none=True), mimetype="application/json")
 
         response = client.patch(
             "/users-empty/1", json={}, content_type="application/json"
         )
         assert response.status_code == 200
-        data = response.get_json()
-        assert data["updates"] == {}
+        assert json_of(response) == {}
 
 
 class TestSchemaTypeCompatibility:
@@ -368,57 +366,36 @@ class TestSchemaTypeCompatibility:
 
     def test_schema_is_marshmallow_schema(self):
         """PydanticSchema is recognized as Marshmallow Schema."""
-        SearchSchema = schema_for(SearchQuery)
         assert issubclass(SearchSchema, Schema)
 
         schema = SearchSchema()
         assert isinstance(schema, Schema)
 
-    def test_schema_has_load_method(self):
+    def test_schema_has_load_method(self, search_schema):
         """PydanticSchema has required load method."""
-        SearchSchema = schema_for(SearchQuery)
-        schema = SearchSchema()
-
-        assert hasattr(schema, "load")
-        assert callable(schema.load)
+        assert hasattr(search_schema, "load")
+        assert callable(search_schema.load)
 
-    def test_schema_has_fields(self):
+    def test_schema_has_fields(self, search_schema):
         """PydanticSchema has fields attribute."""
-        SearchSchema = schema_for(SearchQuery)
-        schema = SearchSchema()
-
-        assert hasattr(schema, "fields")
-        assert "query" in schema.fields
-        assert "limit" in schema.fields
+        assert hasattr(search_schema, "fields")
+        assert "query" in search_schema.fields
+        assert "limit" in search_schema.fields
 
 
 class TestMultipleLocations:
     """Test parsing from multiple locations."""
 
-    def test_query_and_json_together(self, app, client):
+    def test_query_and_json_together(self, app, client, item_schema, filter_schema):
         """Can parse from both query params and JSON body."""
-        FilterSchema = schema_for(FilterParams)
-        ItemSchema = schema_for(ItemCreate)
-
-        filter_schema = FilterSchema()
-        item_schema = ItemSchema()
+        captured = []
 
         @app.route("/items-filtered", methods=["POST"])
         @use_args(filter_schema, location="query")
         @use_args(item_schema, location="json")
         def create_item_filtered(filter_args, item_args):
-            return (
-                jsonify(
-                    {
-                        "filter": {
-                            "page": filter_args.page,
-                            "per_page": filter_args.per_page,
-                        },
-                        "item": {"name": item_args.name, "price": item_args.price},
-                    }
-                ),
-                201,
-            )
+            captured.append((filter_args, item_args))
+            return "", 201
 
         response = client.post(
             "/items-filtered?page=2&per_page=50",
@@ -426,41 +403,43 @@ class TestMultipleLocations:
             content_type="application/json",
         )
         assert response.status_code == 201
-        data = response.get_json()
-        assert data["filter"]["page"] == 2
-        assert data["item"]["name"] == "Widget"
+        ((filter_args, item_args),) = captured
+        assert filter_args.page == 2
+        assert filter_args.per_page == 50
+        assert item_args.name == "Widget"
+        assert item_args.price == 9.99
 
 
 class TestEdgeCases:
     """Test edge cases and error scenarios."""
 
-    def test_empty_query_string(self, app, client):
+    def test_empty_query_string(self, app, client, filter_schema):
         """Handles empty query string with defaults."""
-        FilterSchema = schema_for(FilterParams)
-        filter_schema = FilterSchema()
+        captured = []
 
         @app.route("/items-edge")
         @use_args(filter_schema, location="query")
         def list_items_edge(args):
-            return jsonify({"page": args.page})
+            captured.append(args)
+            return "", 204
 
         response = client.get("/items-edge")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["page"] == 1  # default
+        assert response.status_code == 204
+        (args,) = captured
+        assert args.page == 1  # default
 
-    def test_extra_fields_ignored(self, app, client):
+    def test_extra_fields_ignored(self, app, client, search_schema):
         """Extra fields in request are ignored."""
-        SearchSchema = schema_for(SearchQuery)
-        search_schema = SearchSchema()
+        captured = []
 
         @app.route("/search-extra")
         @use_args(search_schema, location="query")
         def search_extra(args):
-            return jsonify({"query": args.query})
+            captured.append(args)
+            return "", 204
 
         response = client.get("/search-extra?query=test&extra_field=ignored")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["query"] == "test"
-        assert "extra_field" not in data
+        assert response.status_code == 204
+        (args,) = captured
+        assert args.query == "test"
+        assert "extra_field" not in args.model_dump()
@@ -14,10 +14,15 @@ from uuid import UUID
 import pytest
 from marshmallow import post_load, pre_load, validates, validates_schema
 from marshmallow.exceptions import ValidationError
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, computed_field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
 
 from pydantic_marshmallow import PydanticSchema, schema_for
 
+# Plain-str email regex for the shared models (here and in the compatibility
+# conftest): pydantic-core matches it in Rust, avoiding a call into
+# email-validator for every load.
+EMAIL_PATTERN = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+
 # =============================================================================
 # Shared Pydantic Models - Basic
 # =============================================================================
@@ -33,7 +38,7 @@ class ValidatedUser(BaseModel):
     """User model with validation constraints."""
     name: str = Field(min_length=1, max_length=100)
     age: int = Field(ge=0, le=150)
-    email: EmailStr
+    email: str = Field(pattern=EMAIL_PATTERN)
     score: float = Field(ge=0, le=100, default=0.0)
 
 
@@ -88,7 +93,7 @@ class Address(BaseModel):
 class Person(BaseModel):
     """Person with nested address."""
     name: str
-    email: EmailStr
+    email: str = Field(pattern=EMAIL_PATTERN)
     address: Address
 
 
@@ -237,26 +242,28 @@ BATCH_USERS = [
 # =============================================================================
 # Schema Fixtures
 # =============================================================================
+# Instances are shared for the whole session; tests only load/dump through
+# them. Use schema_factory when a test needs many/partial/context options.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_user_schema():
     """Pre-built schema for SimpleUser."""
     return schema_for(SimpleUser)()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validated_user_schema():
     """Pre-built schema for ValidatedUser."""
     return schema_for(ValidatedUser)()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def person_schema():
     """Pre-built schema for Person with nested Address."""
     return schema_for(Person)()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def order_schema():
     """Pre-built schema for Order with nested Items."""
     return schema_for(Order)()
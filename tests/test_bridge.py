@@ -2,13 +2,14 @@
 
 import queue
 import threading
+from collections.abc import Mapping
 
 import pytest
-from marshmallow import ValidationError, pre_load
+from marshmallow import EXCLUDE, ValidationError, pre_load
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from pydantic_marshmallow import HybridModel, PydanticSchema, schema_for
-from pydantic_marshmallow.bridge import _hybrid_instance_cache, _hybrid_schema_cache
+from pydantic_marshmallow.bridge import _hybrid_instance_cache, _hybrid_schema_cache, _model_class_cache
 
 
 class TestPydanticSchemaBasic:
@@ -382,6 +383,33 @@ class TestMarshmallowEcosystemCompatibility:
         assert result[0].name == "Alice"
         assert result[1].name == "Bob"
 
+    def test_non_dict_mapping_read_once(self):
+        """Mappings like webargs' MultiDictProxy are materialized in one pass."""
+        class CountingMapping(Mapping):
+            def __init__(self, data):
+                self._data = data
+                self.reads = 0
+
+            def __getitem__(self, key):
+                self.reads += 1
+                return self._data[key]
+
+            def __iter__(self):
+                return iter(self._data)
+
+            def __len__(self):
+                return len(self._data)
+
+        class User(BaseModel):
+            name: str
+            age: int
+
+        payload = CountingMapping({"name": "Alice", "age": 30})
+        result = schema_for(User)().load(payload)
+
+        assert result == User(name="Alice", age=30)
+        assert payload.reads == 2
+
     def test_partial_loading(self):
         """Test partial loading (for updates)."""
         class User(BaseModel):
@@ -484,6 +512,31 @@ class TestPydanticSchemaDecorator:
         assert user2.name == "Bob"
 
 
+# ============================================================================
+# Schema class cache in from_model()
+# ============================================================================
+
+
+class TestFromModelCache:
+    """from_model() converts each model once and reuses the cached class."""
+
+    def test_nested_models_share_interned_schema(self) -> None:
+        """Nested references reuse the cached schema class instead of reconverting."""
+
+        class Leaf(BaseModel):
+            value: str
+
+        class Branch(BaseModel):
+            leaf: Leaf
+            leaves: list[Leaf]
+
+        branch_schema = PydanticSchema.from_model(Branch)
+        leaf_schema = PydanticSchema.from_model(Leaf)
+
+        assert branch_schema._declared_fields["leaf"].nested is leaf_schema
+        assert branch_schema._declared_fields["leaves"].inner.nested is leaf_schema
+
+
 # ============================================================================
 # H5: Cache stampede double-check in from_model()
 # ============================================================================
@@ -531,3 +584,233 @@ class TestCacheStampede:
         assert len(results) == 4
         # All threads should get the same cached class
         assert all(r is results[0] for r in results)
+
+    def test_model_class_resolved_once_per_schema_class(self) -> None:
+        """Instantiating a schema caches its model class and binds model_fields."""
+
+        class Resolved(BaseModel):
+            x: int
+
+        class ResolvedSchema(PydanticSchema[Resolved]):
+            class Meta:
+                model = Resolved
+
+        schema = ResolvedSchema()
+
+        assert _model_class_cache[ResolvedSchema] is Resolved
+        assert schema._model_fields is Resolved.model_fields
+        assert ResolvedSchema()._model_class is Resolved
+
+
+# ============================================================================
+# Generated fast-path dump function
+# ============================================================================
+
+
+class TestFastDumpCodegen:
+    """Simple schemas dump through a generated per-field-map function."""
+
+    def test_generated_dump_matches_field_map(self) -> None:
+        """The generated function only emits the fields selected by only=."""
+
+        class Account(BaseModel):
+            account_id: int
+            owner: str
+            active: bool = True
+
+        schema = schema_for(Account)(only=("account_id", "owner"))
+        account = Account(account_id=7, owner="Alice")
+
+        assert schema._fast_dump_fn is not None
+        assert schema.dump(account) == {"account_id": 7, "owner": "Alice"}
+
+    def test_generated_dump_shared_across_instances(self) -> None:
+        """Instances with the same field map reuse one compiled function."""
+
+        class Point(BaseModel):
+            x: int
+            y: int
+
+        PointSchema = schema_for(Point)
+        first, second = PointSchema(), PointSchema()
+
+        assert first._fast_dump_fn is second._fast_dump_fn
+        assert first.dump(Point(x=1, y=2), many=False) == {"x": 1, "y": 2}
+
+    def test_many_dump_mixes_models_and_dicts(self) -> None:
+        """many=True uses the generated function for models and MA's dump for dicts."""
+
+        class Point(BaseModel):
+            x: int
+            y: int
+
+        schema = schema_for(Point)(many=True)
+        result = schema.dump([Point(x=1, y=2), {"x": 3, "y": 4}])
+
+        assert result == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+
+
+# ============================================================================
+# JSON fast paths for dumps()/loads()
+# ============================================================================
+
+
+class TestJSONFastPaths:
+    """dumps()/loads() use Rust-backed JSON while matching Marshmallow semantics."""
+
+    def test_loads_keeps_large_integers_exact(self) -> None:
+        """Integers wider than 64 bits survive loads() without float rounding."""
+
+        class Ledger(BaseModel):
+            balance: int
+
+        schema = schema_for(Ledger)()
+        result = schema.loads('{"balance": 123456789012345678901234567890}')
+
+        assert result.balance == 123456789012345678901234567890
+
+    def test_loads_invalid_json_raises_stdlib_error(self) -> None:
+        """Malformed input still raises json.JSONDecodeError."""
+        import json
+
+        class Ping(BaseModel):
+            value: int
+
+        with pytest.raises(json.JSONDecodeError):
+            schema_for(Ping)().loads("{not json")
+
+    def test_dumps_encoder_kwargs_fall_back(self) -> None:
+        """Encoder arguments like indent= are honoured via Marshmallow's dumps()."""
+
+        class Ping(BaseModel):
+            value: int
+
+        json_str = schema_for(Ping)().dumps(Ping(value=1), indent=2)
+
+        assert json_str == '{\n  "value": 1\n}'
+
+    def test_dumps_non_str_keys_fall_back(self) -> None:
+        """Values orjson rejects are encoded by the stdlib module instead."""
+
+        class Scores(BaseModel):
+            by_id: dict[int, int]
+
+        json_str = schema_for(Scores)().dumps(Scores(by_id={1: 10}))
+
+        assert json_str == '{"by_id":{"1":10}}'
+
+    def test_dumps_fallbacks_match_orjson_format(self) -> None:
+        """NaN and >64-bit ints fall back without changing separators or non-ASCII output."""
+
+        class Sample(BaseModel):
+            a: int
+            f: float
+            s: str
+
+        schema = schema_for(Sample)()
+
+        assert schema.dumps(Sample(a=1, f=1.5, s="é")) == '{"a":1,"f":1.5,"s":"é"}'
+        assert schema.dumps(Sample(a=1, f=float("nan"), s="é")) == '{"a":1,"f":NaN,"s":"é"}'
+        assert schema.dumps(Sample(a=2**64, f=1.5, s="é")) == (
+            '{"a":18446744073709551616,"f":1.5,"s":"é"}'
+        )
+
+    @pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+    def test_dumps_non_finite_floats_round_trip(self, value: float) -> None:
+        """NaN and infinities are written as stdlib JSON tokens, not null."""
+        import math
+
+        class Reading(BaseModel):
+            x: float
+
+        schema = schema_for(Reading)()
+        json_str = schema.dumps(Reading(x=value))
+        result = schema.loads(json_str)
+
+        assert "null" not in json_str
+        if math.isnan(value):
+            assert math.isnan(result.x)
+        else:
+            assert result.x == value
+
+    def test_loads_union_fields_match_load(self) -> None:
+        """Smart-union selection in loads() matches load() of the decoded JSON."""
+        import json
+        from datetime import date
+        from uuid import UUID
+
+        class Ref(BaseModel):
+            u: UUID | str
+            d: date | str
+
+        schema = schema_for(Ref, unknown=EXCLUDE)()
+        json_str = '{"u": "12345678-1234-5678-1234-567812345678", "d": "2024-01-01"}'
+
+        result = schema.loads(json_str)
+
+        assert result == schema.load(json.loads(json_str))
+        assert isinstance(result.u, str)
+        assert isinstance(result.d, str)
+
+    def test_loads_validators_see_python_mode(self) -> None:
+        """Field validators run in python mode under loads(), as they do under load()."""
+        import json
+
+        from pydantic import ValidationInfo
+
+        class Tagged(BaseModel):
+            mode: str = ""
+
+            @field_validator("mode")
+            @classmethod
+            def record_mode(cls, v: str, info: ValidationInfo) -> str:
+                return info.mode
+
+        schema = schema_for(Tagged, unknown=EXCLUDE)()
+        json_str = '{"mode": ""}'
+
+        result = schema.loads(json_str)
+
+        assert result == schema.load(json.loads(json_str))
+        assert result.mode == "python"
+
+    def test_loads_errors_match_load(self) -> None:
+        """Unknown-field and validation errors from loads() match load()."""
+
+        class Account(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            name: str
+            age: int = Field(ge=0)
+
+        schema = schema_for(Account)()
+
+        with pytest.raises(ValidationError) as unknown_exc:
+            schema.loads('{"name": "a", "age": 1, "nickname": "b"}')
+        with pytest.raises(ValidationError) as invalid_exc:
+            schema.loads('{"name": "a", "age": -1}')
+
+        assert unknown_exc.value.messages == {"nickname": ["Unknown field."]}
+        assert invalid_exc.value.messages == schema.validate({"name": "a", "age": -1})
+        assert invalid_exc.value.valid_data == {"name": "a"}
+
+    def test_loads_default_unknown_still_raises(self) -> None:
+        """unknown=RAISE on an extra='ignore' model still reports unknown fields."""
+
+        class Ping(BaseModel):
+            value: int
+
+        with pytest.raises(ValidationError) as exc:
+            schema_for(Ping)().loads('{"value": 1, "extra": 2}')
+
+        assert exc.value.messages == {"extra": ["Unknown field."]}
+
+    def test_loads_strict_model_keeps_python_mode(self) -> None:
+        """Strict models reject ISO strings in loads(), as python-mode load() does."""
+        from datetime import datetime
+
+        class Event(BaseModel):
+            model_config = ConfigDict(strict=True)
+            at: datetime
+
+        with pytest.raises(ValidationError):
+            schema_for(Event)(unknown=EXCLUDE).loads('{"at": "2024-01-01T00:00:00"}')
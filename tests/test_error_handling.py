@@ -10,7 +10,7 @@ Features tested:
 
 import pytest
 from marshmallow.exceptions import ValidationError
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from pydantic_marshmallow import BridgeValidationError, PydanticSchema, schema_for
 
@@ -322,6 +322,27 @@ class TestErrorHandlingIntegration:
         assert isinstance(errors, dict)
         assert "age" in errors
 
+    def test_validate_runs_single_pydantic_pass(self):
+        """validate() validates each payload exactly once (no second load pass)."""
+        calls: list[int] = []
+
+        class Counted(BaseModel):
+            value: int
+
+            @field_validator("value")
+            @classmethod
+            def count_calls(cls, v: int) -> int:
+                calls.append(v)
+                if v < 0:
+                    raise ValueError("must be non-negative")
+                return v
+
+        schema = schema_for(Counted)()
+
+        assert schema.validate({"value": 1}) == {}
+        assert "value" in schema.validate({"value": -1})
+        assert calls == [1, -1]
+
     def test_multiple_errors_same_field(self):
         """Multiple errors on same field are collected."""
         class StrictUser(BaseModel):
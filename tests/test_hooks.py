@@ -7,7 +7,7 @@ pre_dump, post_dump) work correctly with the Pydantic bridge.
 from typing import Any
 
 import pytest
-from marshmallow import ValidationError, post_dump, post_load, pre_dump, pre_load
+from marshmallow import ValidationError, missing, post_dump, post_load, pre_dump, pre_load
 from pydantic import BaseModel
 
 from pydantic_marshmallow import PydanticSchema
@@ -125,6 +125,26 @@ class TestPreLoadHooks:
 
         assert "empty" in str(exc.value).lower()
 
+    def test_pre_load_missing_sentinel_uses_model_default(self):
+        """Values set to marshmallow.missing by pre_load fall back to Pydantic defaults."""
+        class Settings(BaseModel):
+            theme: str = "light"
+            name: str
+
+        class SettingsSchema(PydanticSchema[Settings]):
+            class Meta:
+                model = Settings
+
+            @pre_load
+            def drop_blank_theme(self, data: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+                if not data.get("theme"):
+                    data = {**data, "theme": missing}
+                return data
+
+        result = SettingsSchema().load({"name": "Alice", "theme": ""})
+
+        assert result.theme == "light"
+
 
 class TestPostLoadHooks:
     """Test @post_load hooks run after Pydantic creates the model."""
@@ -5,6 +5,7 @@ Covers:
 - Literal → OneOf validation (M1)
 - Variable-length tuple type preservation (M2)
 - IP type exact matching + hasattr guard (M3+M4)
+- Collection origin dispatch table
 """
 
 from __future__ import annotations
@@ -20,6 +21,8 @@ from pydantic import BaseModel
 
 from pydantic_marshmallow.bridge import PydanticSchema
 from pydantic_marshmallow.type_mapping import (
+    _ORIGIN_FIELD_FACTORIES,
+    _get_pydantic_special_field_class,
     _processing_lock,
     _processing_models,
     type_to_marshmallow_field,
@@ -215,3 +218,73 @@ class TestIPTypeMatching:
         finally:
             if ip_attr is not None:
                 ma_fields.IP = ip_attr  # type: ignore[attr-defined]
+
+
+# ============================================================================
+# Collection origin dispatch table
+# ============================================================================
+
+
+class TestOriginFieldFactories:
+    """Generic collection origins resolve through _ORIGIN_FIELD_FACTORIES."""
+
+    def test_table_covers_collection_origins(self) -> None:
+        assert set(_ORIGIN_FIELD_FACTORIES) == {list, set, frozenset, dict, tuple}
+
+    @pytest.mark.parametrize(
+        "type_hint,field_type,inner_type",
+        [
+            (list[int], ma_fields.List, ma_fields.Integer),
+            (set[str], ma_fields.List, ma_fields.String),
+            (frozenset[bool], ma_fields.List, ma_fields.Boolean),
+        ],
+        ids=["list", "set", "frozenset"],
+    )
+    def test_list_like_origins(self, type_hint: type, field_type: type, inner_type: type) -> None:
+        field = type_to_marshmallow_field(type_hint)
+        assert isinstance(field, field_type)
+        assert isinstance(field.inner, inner_type)
+
+    def test_dict_origin(self) -> None:
+        field = type_to_marshmallow_field(dict[str, int])
+        assert isinstance(field, ma_fields.Dict)
+        assert isinstance(field.key_field, ma_fields.String)
+        assert isinstance(field.value_field, ma_fields.Integer)
+
+    def test_optional_collection_still_allows_none(self) -> None:
+        """list[T] | None unwraps the Union before hitting the table."""
+        field = type_to_marshmallow_field(list[int] | None)
+        assert isinstance(field, ma_fields.List)
+        assert field.allow_none is True
+
+
+# ============================================================================
+# Cached Pydantic special-type lookup
+# ============================================================================
+
+
+class TestPydanticSpecialFieldCache:
+    """Pydantic special types resolve through a per-type cached lookup."""
+
+    def test_email_and_url_types(self) -> None:
+        from pydantic import AnyUrl, EmailStr, HttpUrl
+
+        assert isinstance(type_to_marshmallow_field(EmailStr), ma_fields.Email)
+        assert isinstance(type_to_marshmallow_field(AnyUrl), ma_fields.URL)
+        assert isinstance(type_to_marshmallow_field(HttpUrl), ma_fields.URL)
+
+    def test_lookup_is_cached_per_type(self) -> None:
+        from pydantic import AnyUrl
+
+        _get_pydantic_special_field_class.cache_clear()
+        type_to_marshmallow_field(AnyUrl)
+        type_to_marshmallow_field(AnyUrl)
+        info = _get_pydantic_special_field_class.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_non_pydantic_type_returns_none(self) -> None:
+        class Custom:
+            pass
+
+        assert _get_pydantic_special_field_class(Custom) is None
@@ -8,9 +8,12 @@ Consolidated tests for:
 Uses parameterization for comprehensive constraint coverage.
 """
 
+from typing import Annotated
+
 import pytest
 from marshmallow.exceptions import ValidationError
-from pydantic import BaseModel, Field
+from marshmallow.validate import Length, Regexp
+from pydantic import BaseModel, Field, StringConstraints
 
 from pydantic_marshmallow import schema_for
 from pydantic_marshmallow.validators import cache_validators, validates, validates_schema
@@ -119,6 +122,28 @@ class TestStringConstraints:
             with pytest.raises(ValidationError):
                 schema.load({"value": value})
 
+    def test_string_constraints_strip_and_length(self):
+        """StringConstraints strips whitespace before checking length."""
+        class Model(BaseModel):
+            name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+        schema = schema_for(Model)()
+
+        assert schema.load({"name": "  Alice  "}).name == "Alice"
+        with pytest.raises(ValidationError):
+            schema.load({"name": "   "})
+
+    def test_string_constraints_without_pattern_add_no_regexp(self):
+        """StringConstraints(pattern=None) contributes Length but no Regexp validator."""
+        class Model(BaseModel):
+            name: Annotated[str, StringConstraints(min_length=1, max_length=100)]
+
+        field = schema_for(Model)().fields["name"]
+
+        assert not any(isinstance(v, Regexp) for v in field.validators)
+        lengths = [v for v in field.validators if isinstance(v, Length)]
+        assert [(v.min, v.max) for v in lengths] == [(1, 100)]
+
 
 # =============================================================================
 # Numeric Constraint Tests (parameterized)